@@ -0,0 +1,97 @@
+"""
+Hangman Bot Loader
+
+Loads HangmanBot classes from bot files and saves/loads trained bots as
+artifacts. Kept free of the Flask/Dash web stack, so command line tools and
+worker processes can load bots without importing it.
+
+Usage:
+    from bot_loader import load_bot_class, save_bot_artifact, load_bot_artifact
+    bot = load_bot_class('python')(training_words)   # files need no .py suffix
+    save_bot_artifact(bot, 'python', 'artifacts/python.pkl')
+    bot = load_bot_artifact('artifacts/python.pkl')
+"""
+
+import sys
+import pickle
+import importlib.util
+import importlib.machinery
+from pathlib import Path
+
+# Bump when the artifact layout written by save_bot_artifact changes
+ARTIFACT_VERSION = 1
+
+def load_bot_class(path):
+    """
+    Load the HangmanBot class from a bot file
+
+    A file that is already imported (e.g. user_template.py when running it)
+    is not executed again; its HangmanBot is returned as is.
+
+    Args:
+        path: Bot file (the suffix does not need to be .py)
+
+    Returns:
+        type: The file's HangmanBot class
+    """
+    resolved = Path(path).resolve()
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, '__file__', None)
+        if module_file and hasattr(module, 'HangmanBot') and Path(module_file).resolve() == resolved:
+            return module.HangmanBot
+
+    module_name = f"bot_{abs(hash(str(path)))}"
+    loader = importlib.machinery.SourceFileLoader(module_name, str(path))
+    spec = importlib.util.spec_from_file_location(module_name, path, loader=loader)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.HangmanBot
+
+def save_bot_artifact(bot, bot_file, path):
+    """
+    Save a trained bot so it can be loaded later without retraining
+
+    Only the bot's attributes are pickled, together with the file its class
+    comes from, so bots defined in files without a .py suffix work too.
+    The bot class's STATE_VERSION is saved with them, so artifacts whose
+    attributes no longer match the bot's code are rejected on load.
+    """
+    # Bots that hold unpicklable attributes (e.g. locks) leave them out in __getstate__
+    state = bot.__getstate__() if hasattr(bot, '__getstate__') else bot.__dict__
+    artifact = {
+        'version': ARTIFACT_VERSION,
+        'bot_file': bot_file,
+        'state_version': getattr(type(bot), 'STATE_VERSION', 0),
+        'state': state
+    }
+    with open(path, 'wb') as f:
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def load_bot_artifact(path):
+    """
+    Load a bot saved with save_bot_artifact (only load artifacts you trust!)
+
+    Raises:
+        ValueError: The artifact was saved by an older version of the bot or
+            of this function (rebuild it with --build-artifacts)
+    """
+    with open(path, 'rb') as f:
+        artifact = pickle.load(f)
+
+    if artifact.get('version') != ARTIFACT_VERSION:
+        raise ValueError(f"{path} uses unsupported artifact version {artifact.get('version')}; "
+                         f"rebuild it with --build-artifacts")
+
+    bot_class = load_bot_class(artifact['bot_file'])
+    state_version = getattr(bot_class, 'STATE_VERSION', 0)
+    if artifact['state_version'] != state_version:
+        raise ValueError(f"{path} was saved by state version {artifact['state_version']} of "
+                         f"{artifact['bot_file']}, which is now at version {state_version}; "
+                         f"rebuild it with --build-artifacts")
+
+    bot = bot_class.__new__(bot_class)
+    if hasattr(bot, '__setstate__'):
+        bot.__setstate__(artifact['state'])
+    else:
+        bot.__dict__.update(artifact['state'])
+    return bot
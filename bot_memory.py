@@ -0,0 +1,252 @@
+"""
+Hangman Bot Memory Accounting
+
+Deep size accounting for bot data structures, so serving containers can be
+sized from measurements instead of guesswork.
+
+Usage:
+    python test_bot.py --memory-report                # template bot
+    python test_bot.py --memory-report python         # any bot file
+
+    from bot_memory import structure_report, measure_training
+    report = structure_report(bot)          # resident bytes by structure and length
+    training = measure_training(HangmanBot, training_words)   # peak vs steady state
+
+Sizes are "deep": a list counts its own slots plus every string it holds, a
+Counter counts its hash table plus keys and values. An object referenced from
+several structures (e.g. the same word string in two indexes, or interned
+single letters) is counted once, under the first attribute that reaches it,
+so the per-structure figures add up to the total.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+def deep_sizeof(obj, seen=None):
+    """
+    Bytes held by obj and everything reachable from it
+
+    Args:
+        obj: Object to measure
+        seen: Set of object ids already counted (shared between calls so that
+            shared objects are counted once)
+
+    Returns:
+        int: Size in bytes
+    """
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+
+        if isinstance(current, (str, bytes, bytearray, int, float, bool, type(None))):
+            continue
+        if NUMPY_AVAILABLE and isinstance(current, np.ndarray):
+            # getsizeof already includes the buffer when the array owns it
+            if current.base is not None:
+                stack.append(current.base)
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, '__dict__') and not isinstance(current, type):
+            stack.append(current.__dict__)
+    return size
+
+def _length_buckets(value, seen):
+    """
+    Per word-length split of one structure, or None if it has no length structure
+
+    Dicts keyed by word length (words_by_length, length_freq, ...) are split by
+    key; lists of words are split by word length.
+    """
+    if isinstance(value, dict) and value and all(isinstance(k, int) for k in value):
+        return {length: deep_sizeof(item, seen) for length, item in value.items()}
+
+    if isinstance(value, list) and value and all(isinstance(w, str) for w in value):
+        buckets = defaultdict(int)
+        for word in value:
+            # One list slot per word plus the word itself (if not counted yet)
+            buckets[len(word)] += 8 + deep_sizeof(word, seen)
+        return dict(buckets)
+
+    return None
+
+def _index_fields(value, seen):
+    """
+    Per field and word length split of a per-length index, or None if value is not one
+
+    A per-length index (e.g. index_by_length) maps each word length to a dict
+    of named structures ({"words": [...], "masks": [...], ...}). Each field is
+    measured on its own, so the report shows which of them takes the memory.
+
+    Returns:
+        tuple: (overhead, fields) where overhead is the bytes of the containers
+            themselves and their keys by word length, and fields maps each
+            field name -> {word length -> bytes}
+    """
+    if not (isinstance(value, dict) and value and all(isinstance(k, int) for k in value)):
+        return None
+    if not all(isinstance(item, dict) and item and all(isinstance(k, str) for k in item)
+               for item in value.values()):
+        return None
+
+    overhead = defaultdict(int)
+    fields = defaultdict(dict)
+    for length, item in value.items():
+        # The per-length dict and its keys, then every field it holds
+        if id(item) not in seen:
+            seen.add(id(item))
+            overhead[length] += sys.getsizeof(item) + sum(deep_sizeof(key, seen) for key in item)
+        for field, structure in item.items():
+            fields[field][length] = deep_sizeof(structure, seen)
+    return dict(overhead), dict(fields)
+
+def structure_report(bot):
+    """
+    Break down the resident memory of a bot by attribute and word length
+
+    Args:
+        bot: Any bot instance (its instance attributes are measured)
+
+    Returns:
+        dict: total_bytes, structures (attribute -> bytes; each field of a
+              per-length index is listed as "attribute.field"),
+              by_length (word length -> bytes), words, bytes_per_word
+    """
+    seen = {id(bot), id(bot.__dict__)}
+    structures = {}
+    by_length = defaultdict(int)
+
+    for name, value in vars(bot).items():
+        index = _index_fields(value, seen) if id(value) not in seen else None
+        if index is not None:
+            overhead, fields = index
+            seen.add(id(value))
+            for length, size in overhead.items():
+                by_length[length] += size
+            structures[name] = sys.getsizeof(value) + sum(overhead.values())
+            for field, buckets in fields.items():
+                for length, size in buckets.items():
+                    by_length[length] += size
+                structures[f"{name}.{field}"] = sum(buckets.values())
+            continue
+
+        buckets = _length_buckets(value, seen)
+        if buckets is None:
+            structures[name] = deep_sizeof(value, seen)
+            continue
+        # The container itself plus its (not yet counted) contents
+        container = sys.getsizeof(value) if id(value) not in seen else 0
+        seen.add(id(value))
+        for length, size in buckets.items():
+            by_length[length] += size
+        structures[name] = container + sum(buckets.values())
+
+    words = _word_count(bot)
+    total = sys.getsizeof(bot) + sys.getsizeof(bot.__dict__) + sum(structures.values())
+    return {
+        'total_bytes': total,
+        'structures': structures,
+        'by_length': dict(sorted(by_length.items())),
+        'words': words,
+        'bytes_per_word': total / words if words else 0.0
+    }
+
+def _word_count(bot):
+    """Number of training words a bot holds (0 if it cannot be told)"""
+    training_words = getattr(bot, 'training_words', None)
+    if isinstance(training_words, list):
+        return len(training_words)
+    words_by_length = getattr(bot, 'words_by_length', None)
+    if isinstance(words_by_length, dict):
+        return sum(len(words) for words in words_by_length.values())
+    return 0
+
+def measure_training(bot_class, training_words, **kwargs):
+    """
+    Train a bot under tracemalloc and report peak vs steady-state memory
+
+    Args:
+        bot_class: Bot class to instantiate
+        training_words: Training corpus
+        **kwargs: Extra constructor arguments
+
+    Returns:
+        tuple: (bot, dict with seconds, peak_bytes and steady_bytes)
+            peak_bytes is the highest allocation above the starting point while
+            training; steady_bytes is what is still allocated afterwards.
+    """
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    start = time.perf_counter()
+    bot = bot_class(training_words, **kwargs)
+    seconds = time.perf_counter() - start
+
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    if not was_tracing:
+        tracemalloc.stop()
+
+    return bot, {
+        'seconds': seconds,
+        'peak_bytes': peak - baseline,
+        'steady_bytes': current - baseline
+    }
+
+def format_bytes(size):
+    """Human-readable byte count"""
+    for unit in ('B', 'KB', 'MB'):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+def print_memory_report(report, training=None):
+    """Print a structure report (and optional training measurement)"""
+    print("\n" + "=" * 60)
+    print("BOT MEMORY REPORT")
+    print("=" * 60)
+    print(f"Resident size: {format_bytes(report['total_bytes'])}")
+    print(f"Training words: {report['words']}")
+    print(f"Bytes per word: {report['bytes_per_word']:.1f}")
+
+    if training:
+        print(f"\nTraining time: {training['seconds']:.2f} seconds")
+        print(f"Peak during training: {format_bytes(training['peak_bytes'])}")
+        print(f"Steady state after training: {format_bytes(training['steady_bytes'])}")
+
+    print("\nBy Structure:")
+    print("-" * 30)
+    total = report['total_bytes'] or 1
+    for name, size in sorted(report['structures'].items(), key=lambda item: -item[1]):
+        print(f"{name}: {format_bytes(size)} ({(size / total) * 100:.1f}%)")
+
+    if report['by_length']:
+        print("\nBy Word Length:")
+        print("-" * 30)
+        for length, size in report['by_length'].items():
+            print(f"Length {length}: {format_bytes(size)}")
@@ -0,0 +1,289 @@
+"""
+Hangman Bot Profiler
+
+Profiles simulation runs without editing the bot:
+
+- StackSampler samples the call stack of the running thread at a fixed
+  interval and writes collapsed stacks ("a;b;c 42" per line), the input
+  format of flamegraph.pl, speedscope and inferno.
+- top_functions turns the same samples into a top-N table of self and total
+  time per function.
+- SectionTimer times every line of a bot's predict_next_letter (and of the
+  helpers it calls from the same file) and groups the lines into the
+  "Step N" sections marked by its comments, so filter, count and fallback
+  costs show up separately.
+
+Usage:
+    python test_bot.py --profile                      # template bot
+    python test_bot.py --profile python --line-timing
+    flamegraph.pl profile.folded > profile.svg
+"""
+
+import os
+import re
+import sys
+import time
+import inspect
+import threading
+from collections import Counter, defaultdict
+
+# Comment that opens a section, e.g. "# Step 3 + 4: Find all possible matching words"
+STEP_PATTERN = re.compile(r'#\s*(Step\s+\d+(?:\s*\+\s*\d+)*)\s*:?\s*(.*)')
+
+def frame_label(code):
+    """Flamegraph frame name for a code object: file:function"""
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+class StackSampler:
+    """
+    Statistical profiler: samples one thread's stack every interval seconds
+
+    Sampling runs on a background thread, so the profiled code runs
+    unmodified; the GIL switch interval is lowered while sampling so samples
+    are taken on time.
+    """
+
+    def __init__(self, interval=0.001, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._switch_interval = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(frame_label(frame.f_code))
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        """Start sampling"""
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 2))
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling"""
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def write_collapsed(self, path):
+        """Write the samples as collapsed stacks (one "frame;frame;... count" per line)"""
+        with open(path, 'w') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+def top_functions(stacks, n=20):
+    """
+    Self and total sample counts per function
+
+    Args:
+        stacks: Counter of collapsed stack -> samples
+        n: Number of functions to return
+
+    Returns:
+        list: (function, self samples, total samples), most self time first
+    """
+    self_samples = Counter()
+    total_samples = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(';')
+        self_samples[frames[-1]] += count
+        # Count recursive functions once per stack
+        for frame in set(frames):
+            total_samples[frame] += count
+
+    ranked = sorted(total_samples, key=lambda frame: (-self_samples[frame], -total_samples[frame]))
+    return [(frame, self_samples[frame], total_samples[frame]) for frame in ranked[:n]]
+
+def print_top_functions(sampler, n=20):
+    """Print the top-N table of a StackSampler"""
+    total = sampler.samples or 1
+    print(f"\nTop {n} Functions ({sampler.samples} samples, {sampler.interval * 1000:.1f} ms interval):")
+    print("-" * 60)
+    print(f"{'Self %':>8}{'Total %':>9}  Function")
+    for frame, self_count, total_count in top_functions(sampler.stacks, n):
+        print(f"{(self_count / total) * 100:>7.1f}%{(total_count / total) * 100:>8.1f}%  {frame}")
+
+def step_sections(lines, first_line, default=None):
+    """
+    Section of every line of a function, from its "Step N" comments
+
+    A section's label is its whole comment: comment lines right after the
+    "Step N" line continue the label, up to a separator line ("# ----") or
+    the first line of code.
+
+    Args:
+        lines: Source lines of the function
+        first_line: Line number of lines[0]
+        default: Section of the lines before the first "Step" comment
+
+    Returns:
+        dict: Line number -> (section label, line the section starts at)
+    """
+    starts = []
+    continuing = False
+    for offset, line in enumerate(lines):
+        stripped = line.strip()
+        match = STEP_PATTERN.search(line)
+        if match:
+            starts.append([first_line + offset, f"{match.group(1)}: {match.group(2).strip()}".rstrip(': ')])
+            continuing = stripped.startswith('#')
+        elif continuing and stripped.startswith('#') and stripped.strip('#-= '):
+            starts[-1][1] += ' ' + stripped.lstrip('#').strip()
+        else:
+            continuing = False
+
+    sections = {}
+    section = (default, first_line)
+    labels = dict(starts)
+    for number in range(first_line, first_line + len(lines)):
+        if number in labels:
+            section = (labels[number], number)
+        sections[number] = section
+    return sections
+
+class SectionTimer:
+    """
+    Line-level timing of one function, grouped into its "Step N" sections
+
+    Functions from the same file that it calls (helpers such as a bot's
+    _count_letters) are traced too, and their lines count towards the
+    section of the line that called them. A helper with "Step" comments of
+    its own splits that time further into sub-sections, labelled
+    "calling section > helper section". Time spent in any other function
+    (builtins, library code) counts towards the line that called it.
+    Tracing slows the bot down noticeably, so use the times for comparing
+    sections, not as absolute latencies.
+    """
+
+    def __init__(self, function):
+        function = inspect.unwrap(getattr(function, '__func__', function))
+        self.code = function.__code__
+        self.line_times = defaultdict(float)
+        self.line_hits = Counter()
+        self.section_seconds = defaultdict(float)
+        self.calls = 0
+
+        # Source lines and own sections of every traced function
+        self.source = {}
+        self.sections = {}
+        self._section_order = {}
+        self._own_sections(self.code, 'setup')
+
+        # One entry per traced frame that is running: (section its lines
+        # without an own section count towards, line of the caller to resume)
+        self._stack = []
+        self._slot = None  # (line, section) the clock is running for
+        self._since = 0.0
+
+    def _own_sections(self, code, default=None):
+        """Line -> (section, start line) of a traced function (cached per code object)"""
+        if code not in self.sections:
+            sections = {}
+            # Comprehensions and lambdas belong to the section they are used in
+            if not code.co_name.startswith('<'):
+                try:
+                    lines, first_line = inspect.getsourcelines(code)
+                except (OSError, TypeError):
+                    lines, first_line = [], 0
+                self.source.update((first_line + i, line.rstrip()) for i, line in enumerate(lines))
+                sections = step_sections(lines, first_line, default)
+            self.sections[code] = sections
+        return self.sections[code]
+
+    def _section(self, code, line):
+        """Section a line of a traced function counts towards"""
+        own, start = self._own_sections(code).get(line, (None, line))
+        if not self._stack:
+            return own or 'setup'
+        calling = self._stack[-1][0]
+        if own is None:
+            return calling
+        section = own if code is self.code else f"{calling} > {own}"
+        if section not in self._section_order:
+            parent = () if code is self.code else self._section_order.get(calling, ())
+            self._section_order[section] = parent + (start,)
+        return section
+
+    def _charge(self):
+        """Add the time since the last event to the running line and section"""
+        if self._slot is not None:
+            elapsed = time.perf_counter() - self._since
+            line, section = self._slot
+            self.line_times[line] += elapsed
+            self.section_seconds[section] += elapsed
+
+    def _global_trace(self, frame, event, arg):
+        if event != 'call':
+            return None
+        code = frame.f_code
+        if code is self.code:
+            self.calls += 1
+        elif not self._stack or code.co_filename != self.code.co_filename:
+            return None
+
+        self._charge()
+        calling = self._slot[1] if self._slot else 'setup'
+        self._stack.append((calling, self._slot))
+        self._slot = (frame.f_lineno, self._section(code, frame.f_lineno))
+        self._since = time.perf_counter()
+        return self._local_trace
+
+    def _local_trace(self, frame, event, arg):
+        self._charge()
+        if event == 'line':
+            self.line_hits[frame.f_lineno] += 1
+            self._slot = (frame.f_lineno, self._section(frame.f_code, frame.f_lineno))
+        elif event == 'return':
+            # Back to the calling line (None once the traced function returns)
+            _, self._slot = self._stack.pop()
+        self._since = time.perf_counter()
+        return self._local_trace
+
+    def __enter__(self):
+        sys.settrace(self._global_trace)
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.settrace(None)
+
+    def section_times(self):
+        """Section -> seconds spent in its own lines, in source order (sub-sections after their section)"""
+        order = lambda section: self._section_order.get(section, (0,))
+        return {section: self.section_seconds[section] for section in sorted(self.section_seconds, key=order)}
+
+    def print_report(self, top_lines=10):
+        """Print time per section (including its sub-sections) and the slowest lines"""
+        total = sum(self.line_times.values()) or 1e-12
+        times = self.section_times()
+        print(f"\nLine Timing of {self.code.co_name} ({self.calls} calls):")
+        print("-" * 60)
+        for section in times:
+            seconds = sum(part for name, part in times.items()
+                          if name == section or name.startswith(section + ' > '))
+            depth = section.count(' > ')
+            label = '  ' * depth + ('> ' if depth else '') + section.split(' > ')[-1]
+            print(f"{(seconds / total) * 100:>6.1f}%  {seconds * 1000:>9.1f} ms  {label}")
+
+        print(f"\nSlowest {top_lines} Lines:")
+        print("-" * 60)
+        for number, seconds in sorted(self.line_times.items(), key=lambda item: -item[1])[:top_lines]:
+            print(f"{(seconds / total) * 100:>6.1f}%  line {number:<5} {self.source.get(number, '').strip()[:60]}")
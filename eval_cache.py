@@ -0,0 +1,161 @@
+"""
+Hangman Evaluation Result Cache
+
+Content-addressed, on-disk cache of per-word game results, so re-running
+test_bot.py with an unchanged bot replays nothing and a partly new word set
+only plays the new words.
+
+Results are grouped by a key computed from:
+- the bot's source file (any edit to it invalidates its results)
+- the training corpus
+- the random seed
+Within a key, results are stored per test word, so any test-word list is
+answered from the cached words plus fresh games for the missing ones.
+
+Each key is one SQLite file in the cache directory, so results are appended
+and looked up on disk and a long run does not hold its results in memory.
+When the directory grows past its size limit, the least recently used files
+are deleted.
+
+Usage:
+    cache = ResultCache.for_bot('user_template.py', training_words, seed=None)
+    cached, missing = cache.lookup(test_words)
+    for word in missing:
+        cache.store(play(word))        # a result dict with a 'word' key
+    cache.save()
+"""
+
+import json
+import sqlite3
+import hashlib
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = '.eval_cache'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bump when the stored result format changes
+CACHE_VERSION = 2
+
+# Stored results are committed to disk every this many games
+COMMIT_EVERY = 1000
+
+def evaluation_key(bot_source, training_words, seed=None):
+    """
+    Content hash identifying one bot + corpus + seed combination
+
+    Args:
+        bot_source: Bytes of the bot's source file
+        training_words: Training corpus the bot was built from
+        seed: Random seed of the run (None if unseeded)
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}\0seed={seed}\0".encode())
+    digest.update(hashlib.sha256(bot_source).digest())
+    corpus = hashlib.sha256()
+    for word in training_words:
+        corpus.update(word.encode('utf-8', 'replace'))
+        corpus.update(b'\n')
+    digest.update(corpus.digest())
+    return digest.hexdigest()
+
+class ResultCache:
+    """Per-word game results for one evaluation key, persisted in SQLite"""
+
+    def __init__(self, key, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            key: Evaluation key (see evaluation_key)
+            cache_dir: Directory holding one file per key
+            max_bytes: Size limit of the whole directory
+        """
+        self.key = key
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.path = self.cache_dir / f"{key}.sqlite"
+        self.pending = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS results (word TEXT PRIMARY KEY, result TEXT NOT NULL)")
+
+    @classmethod
+    def for_bot(cls, bot_file, training_words, seed=None, **kwargs):
+        """Open the cache for a bot file, corpus and seed"""
+        with open(bot_file, 'rb') as f:
+            key = evaluation_key(f.read(), training_words, seed)
+        return cls(key, **kwargs)
+
+    def lookup(self, words):
+        """
+        Split words into cached and still to play
+
+        Returns:
+            tuple: (list of cached words, list of missing words)
+        """
+        cached = []
+        missing = []
+        for word in dict.fromkeys(words):
+            row = self.db.execute("SELECT 1 FROM results WHERE word = ?", (word,)).fetchone()
+            (cached if row else missing).append(word)
+        return cached, missing
+
+    def get(self, word):
+        """Cached result for one word (None if not cached)"""
+        row = self.db.execute("SELECT result FROM results WHERE word = ?", (word,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def store(self, result):
+        """Remember the result of one game"""
+        self.db.execute("INSERT OR REPLACE INTO results (word, result) VALUES (?, ?)",
+                        (result['word'], json.dumps(result, separators=(',', ':'))))
+        self.pending += 1
+        if self.pending >= COMMIT_EVERY:
+            self.db.commit()
+            self.pending = 0
+
+    def save(self):
+        """Write new results to disk, close the cache and enforce the size limit"""
+        self.db.commit()
+        self.db.close()
+        self.pending = 0
+        # Mark as recently used
+        self.path.touch()
+        evict(self.cache_dir, self.max_bytes, keep=self.path)
+
+def evict(cache_dir, max_bytes, keep=None):
+    """
+    Delete least recently used cache files until the directory fits max_bytes
+
+    Args:
+        cache_dir: Cache directory
+        max_bytes: Size limit
+        keep: File that is never deleted (the one just used)
+
+    Returns:
+        int: Number of files deleted
+    """
+    files = []
+    for path in Path(cache_dir).iterdir():
+        # .json files are caches written by older versions
+        if path.suffix not in ('.sqlite', '.json'):
+            continue
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in files)
+    removed = 0
+    for _, size, path in sorted(files):
+        if total <= max_bytes:
+            break
+        if keep is not None and path == Path(keep):
+            continue
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
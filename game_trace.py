@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Hangman Game Trace Recorder
+
+Compact, append-only binary traces of every guess a bot makes, so you can
+analyse where it loses without re-running the games.
+
+Usage:
+    python test_bot.py --trace games.trace     # record while testing
+    python game_trace.py games.trace           # analyse a trace
+
+File format (little-endian):
+- 8-byte header: magic b'HMTR', format version (u16), record size (u16)
+- one fixed-size 12-byte record per guess:
+    game id (u32), guess index (u8), letter (u8), flags (u8),
+    word length (u8), latency in microseconds (u32)
+
+Flags: 1 = the guess was a hit, 2 = last guess of the game, 4 = the game was won.
+Because every record has the same size, the reader memory-maps the file as a
+numpy structured array and computes aggregates without parsing it in Python.
+"""
+
+import os
+import sys
+import struct
+
+import numpy as np
+
+MAGIC = b'HMTR'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHH')
+RECORD = struct.Struct('<IBBBBI')
+
+RECORD_DTYPE = np.dtype([
+    ('game', '<u4'),
+    ('index', 'u1'),
+    ('letter', 'u1'),
+    ('flags', 'u1'),
+    ('length', 'u1'),
+    ('latency_us', '<u4'),
+])
+
+FLAG_HIT = 1
+FLAG_LAST = 2
+FLAG_WON = 4
+
+MAX_LATENCY_US = 2 ** 32 - 1
+
+class TraceWriter:
+    """
+    Streaming writer for game traces
+
+    Records are buffered and appended to the file in chunks. Opening an
+    existing trace continues it: new games get ids after the last one written.
+    """
+
+    def __init__(self, path, flush_every=65536):
+        """
+        Args:
+            path: Trace file (created if missing, appended to otherwise)
+            flush_every: Number of buffered records that triggers a write
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self.buffer = bytearray()
+        self.buffered = 0
+        self.next_game = 0
+
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size >= HEADER.size:
+            with open(path, 'rb') as f:
+                _check_header(f.read(HEADER.size), path)
+                # Drop a partially written trailing record, if any
+                records = (size - HEADER.size) // RECORD.size
+                if records:
+                    f.seek(HEADER.size + (records - 1) * RECORD.size)
+                    self.next_game = RECORD.unpack(f.read(RECORD.size))[0] + 1
+            self.file = open(path, 'r+b')
+            self.file.truncate(HEADER.size + records * RECORD.size)
+            self.file.seek(0, os.SEEK_END)
+        else:
+            self.file = open(path, 'wb')
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+
+    def record_game(self, word_length, won, guesses):
+        """
+        Append one game
+
+        Args:
+            word_length: Length of the hidden word
+            won: Whether the bot won
+            guesses: Sequence of (letter, hit, latency in seconds) per guess
+        """
+        if not guesses:
+            return
+
+        game_id = self.next_game
+        self.next_game += 1
+        won_flag = FLAG_WON if won else 0
+        length = min(word_length, 255)
+        last = len(guesses) - 1
+
+        for i, (letter, hit, latency) in enumerate(guesses):
+            flags = won_flag | (FLAG_HIT if hit else 0) | (FLAG_LAST if i == last else 0)
+            code = ord(letter[0]) if isinstance(letter, str) and letter and ord(letter[0]) < 256 else 0
+            latency_us = min(int(latency * 1_000_000), MAX_LATENCY_US)
+            self.buffer += RECORD.pack(game_id, min(i, 255), code, flags, length, latency_us)
+
+        self.buffered += len(guesses)
+        if self.buffered >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to disk"""
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.buffer.clear()
+            self.buffered = 0
+        self.file.flush()
+
+    def close(self):
+        """Flush and close the file"""
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _check_header(header, path):
+    """Validate a trace file header"""
+    if len(header) < HEADER.size:
+        raise ValueError(f"{path} is not a game trace (file too short)")
+    magic, version, record_size = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a game trace (bad magic {magic!r})")
+    if version != VERSION or record_size != RECORD.size:
+        raise ValueError(f"{path} uses unsupported trace format version {version}")
+
+class TraceReader:
+    """Memory-mapped reader computing aggregates over a trace with numpy"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            _check_header(f.read(HEADER.size), path)
+        records = (os.path.getsize(path) - HEADER.size) // RECORD.size
+
+        if records:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode='r',
+                                     offset=HEADER.size, shape=(records,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+
+        # One entry per game: its last guess
+        self.games = self.records[(self.records['flags'] & FLAG_LAST) != 0]
+
+    def summary(self):
+        """Overall games, wins and guesses"""
+        games = len(self.games)
+        wins = int(np.count_nonzero(self.games['flags'] & FLAG_WON))
+        return {
+            'games': games,
+            'wins': wins,
+            'losses': games - wins,
+            'win_rate': (wins / games) * 100 if games else 0.0,
+            'guesses': len(self.records),
+            'avg_guesses': len(self.records) / games if games else 0.0,
+        }
+
+    def losses_by_length(self):
+        """Word length -> (games, losses)"""
+        lengths = self.games['length']
+        lost = (self.games['flags'] & FLAG_WON) == 0
+        totals = np.bincount(lengths, minlength=256)
+        losses = np.bincount(lengths[lost], minlength=256)
+        return {int(n): (int(totals[n]), int(losses[n])) for n in np.flatnonzero(totals)}
+
+    def first_miss_positions(self):
+        """
+        Guess index of each game's first miss
+
+        Returns:
+            tuple: (histogram indexed by guess position, number of games without a miss)
+        """
+        misses = self.records[(self.records['flags'] & FLAG_HIT) == 0]
+        # Records are stored in game order, so the first record per game id is the first miss
+        _, first = np.unique(misses['game'], return_index=True)
+        histogram = np.bincount(misses['index'][first].astype(np.int64), minlength=1)
+        return histogram, len(self.games) - len(first)
+
+    def latency_percentiles(self, percentiles=(50, 90, 99, 99.9)):
+        """Per-guess latency percentiles in milliseconds"""
+        if not len(self.records):
+            return {p: 0.0 for p in percentiles}
+        values = np.percentile(self.records['latency_us'], percentiles) / 1000
+        return dict(zip(percentiles, values.tolist()))
+
+    def latency_by_guess_index(self):
+        """Guess index -> mean latency in milliseconds"""
+        index = self.records['index'].astype(np.int64)
+        counts = np.bincount(index)
+        sums = np.bincount(index, weights=self.records['latency_us'])
+        return {int(i): sums[i] / counts[i] / 1000 for i in np.flatnonzero(counts)}
+
+def print_trace_report(reader):
+    """Print the standard aggregates for a trace"""
+    summary = reader.summary()
+
+    print("=" * 60)
+    print("GAME TRACE REPORT")
+    print("=" * 60)
+    print(f"Games: {summary['games']}")
+    print(f"Wins: {summary['wins']}")
+    print(f"Losses: {summary['losses']}")
+    print(f"Win Rate: {summary['win_rate']:.1f}%")
+    print(f"Average Guesses: {summary['avg_guesses']:.1f}")
+
+    print("\nLosses by Word Length:")
+    print("-" * 30)
+    for length, (games, losses) in reader.losses_by_length().items():
+        print(f"Length {length}: {losses}/{games} lost ({(losses / games) * 100:.1f}%)")
+
+    print("\nFirst Miss Position:")
+    print("-" * 30)
+    histogram, no_miss = reader.first_miss_positions()
+    for position, count in enumerate(histogram):
+        if count:
+            print(f"Guess {position + 1}: {count}")
+    print(f"No miss: {no_miss}")
+
+    print("\nGuess Latency:")
+    print("-" * 30)
+    for percentile, ms in reader.latency_percentiles().items():
+        print(f"p{percentile}: {ms:.3f} ms")
+    for index, ms in reader.latency_by_guess_index().items():
+        print(f"Guess {index + 1}: {ms:.3f} ms avg")
+
+def main():
+    """Analyse a trace file"""
+    if len(sys.argv) != 2:
+        print("Usage: python game_trace.py TRACE_FILE")
+        return 1
+    print_trace_report(TraceReader(sys.argv[1]))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Hangman Letter Model - Feature Encoding and Fast Inference
+
+Shared by training (train_letter_model.py) and any ML-based bot:
+
+- StateEncoder maps (masked_word, wrong_guesses) game states straight into
+  numpy / scipy.sparse rows with a fixed column layout, without building
+  per-state Python dicts or lists.
+- LetterModelBot wraps a fitted scikit-learn classifier (anything with
+  predict_proba) as a HangmanBot, with a batch path that encodes and scores
+  many states in one predict_proba call and masks out already-guessed letters
+  in vectorized form.
+
+Column layout (NUM_FEATURES columns, all values 0/1):
+- MAX_LENGTH * 27 position one-hots: for position p, column p*27 + s where s is
+  0-25 for a revealed letter a-z and 26 for a blank
+- 26 wrong-guess indicators starting at WRONG_OFFSET
+- MAX_LENGTH + 1 word-length one-hots starting at LENGTH_OFFSET
+"""
+
+from typing import Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+
+ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+
+# Longest word the feature layout has room for (longer words are truncated)
+MAX_LENGTH = 32
+
+POSITION_FEATURES = MAX_LENGTH * 27
+WRONG_OFFSET = POSITION_FEATURES
+LENGTH_OFFSET = WRONG_OFFSET + 26
+NUM_FEATURES = LENGTH_OFFSET + MAX_LENGTH + 1
+
+BLANK = 26
+INVALID = 255
+
+# Byte value -> symbol (0-25 letters, 26 blank, 255 anything else)
+SYMBOLS = np.full(256, INVALID, dtype=np.uint8)
+SYMBOLS[np.frombuffer(ALPHABET.encode(), dtype=np.uint8)] = np.arange(26, dtype=np.uint8)
+SYMBOLS[np.frombuffer(ALPHABET.upper().encode(), dtype=np.uint8)] = np.arange(26, dtype=np.uint8)
+SYMBOLS[ord('_')] = BLANK
+
+State = Tuple[str, Iterable[str]]
+
+def _symbols(strings: Sequence[str]):
+    """Concatenate strings and map them to symbols; return (symbols, row, position in row, row lengths)"""
+    lengths = np.fromiter((len(s) for s in strings), dtype=np.int64, count=len(strings))
+    codes = SYMBOLS[np.frombuffer(''.join(strings).encode('ascii', 'replace'), dtype=np.uint8)]
+    rows = np.repeat(np.arange(len(strings), dtype=np.int64), lengths)
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    positions = np.arange(len(codes), dtype=np.int64) - starts
+    return codes, rows, positions, lengths
+
+class StateEncoder:
+    """Vectorized encoder from game states to fixed-layout feature rows"""
+
+    num_features = NUM_FEATURES
+
+    def __init__(self):
+        # Preallocated single-row buffer reused by encode_one
+        self._row = np.zeros((1, NUM_FEATURES), dtype=np.float32)
+        self._active = np.zeros(0, dtype=np.int64)
+
+    def columns(self, masked_word: str, wrong_guesses: Iterable[str]) -> np.ndarray:
+        """Active feature columns of one state"""
+        codes = SYMBOLS[np.frombuffer(masked_word[:MAX_LENGTH].encode('ascii', 'replace'), dtype=np.uint8)]
+        valid = codes != INVALID
+        position_columns = np.flatnonzero(valid) * 27 + codes[valid].astype(np.int64)
+
+        wrong = SYMBOLS[np.frombuffer(''.join(wrong_guesses).encode('ascii', 'replace'), dtype=np.uint8)]
+        wrong_columns = WRONG_OFFSET + np.unique(wrong[wrong < BLANK]).astype(np.int64)
+
+        length_column = LENGTH_OFFSET + min(len(masked_word), MAX_LENGTH)
+        return np.concatenate([position_columns, wrong_columns, [length_column]]).astype(np.int64)
+
+    def encode_one(self, masked_word: str, wrong_guesses: Iterable[str]) -> np.ndarray:
+        """
+        Encode one state into the preallocated dense row
+
+        The returned (1, NUM_FEATURES) array is reused by the next call, so copy
+        it if you need to keep it.
+        """
+        self._row[0, self._active] = 0
+        self._active = self.columns(masked_word, wrong_guesses)
+        self._row[0, self._active] = 1
+        return self._row
+
+    def encode_batch(self, states: Sequence[State]) -> sparse.csr_matrix:
+        """Encode many states into one CSR matrix (one row per state)"""
+        n = len(states)
+        masks = [masked_word for masked_word, _ in states]
+        wrongs = [''.join(wrong_guesses) for _, wrong_guesses in states]
+
+        # Position one-hots
+        codes, rows, positions, lengths = _symbols(masks)
+        keep = (codes != INVALID) & (positions < MAX_LENGTH)
+        position_rows = rows[keep]
+        position_columns = positions[keep] * 27 + codes[keep].astype(np.int64)
+
+        # Wrong-guess indicators
+        wrong_codes, wrong_rows, _, _ = _symbols(wrongs)
+        keep = wrong_codes < BLANK
+        wrong_rows = wrong_rows[keep]
+        wrong_columns = WRONG_OFFSET + wrong_codes[keep].astype(np.int64)
+
+        # Word length one-hot
+        length_rows = np.arange(n, dtype=np.int64)
+        length_columns = LENGTH_OFFSET + np.minimum(lengths, MAX_LENGTH)
+
+        all_rows = np.concatenate([position_rows, wrong_rows, length_rows])
+        all_columns = np.concatenate([position_columns, wrong_columns, length_columns])
+        X = sparse.coo_matrix((np.ones(len(all_rows), dtype=np.float32), (all_rows, all_columns)),
+                              shape=(n, NUM_FEATURES)).tocsr()
+        # Repeated wrong letters would otherwise add up to 2
+        X.data[:] = 1
+        return X
+
+    def guessed_mask(self, states: Sequence[State]) -> np.ndarray:
+        """Boolean (n, 26) array: True where a letter was already revealed or guessed wrong"""
+        mask = np.zeros((len(states), 27), dtype=bool)
+        for strings in ([m for m, _ in states], [''.join(w) for _, w in states]):
+            codes, rows, _, _ = _symbols(strings)
+            keep = codes < BLANK
+            mask[rows[keep], codes[keep]] = True
+        return mask[:, :26]
+
+class LetterModelBot:
+    """
+    HangmanBot backed by a fitted scikit-learn classifier
+
+    The model's classes must be letter indices 0-25 (as produced by
+    train_letter_model.py) or the letters 'a'-'z' themselves.
+    """
+
+    def __init__(self, model, encoder: StateEncoder = None):
+        self.model = model
+        self.encoder = encoder or StateEncoder()
+
+        # Map predict_proba columns onto the 26 letters
+        classes = list(model.classes_)
+        self.class_letters = np.array([
+            c if isinstance(c, (int, np.integer)) else ALPHABET.index(str(c))
+            for c in classes
+        ], dtype=np.int64)
+
+    def letter_scores(self, X, guessed: np.ndarray) -> np.ndarray:
+        """(n, 26) model scores with already-guessed letters set to -inf"""
+        proba = self.model.predict_proba(X)
+        scores = np.full((proba.shape[0], 26), -np.inf)
+        scores[:, self.class_letters] = proba
+        scores[guessed] = -np.inf
+        return scores
+
+    def predict_batch(self, states: Sequence[State]) -> List[str]:
+        """Predict the next letter for many states with one predict_proba call"""
+        if not len(states):
+            return []
+        X = self.encoder.encode_batch(states)
+        scores = self.letter_scores(X, self.encoder.guessed_mask(states))
+        best = np.argmax(scores, axis=1)
+
+        # States where every letter was guessed fall back to 'a'
+        exhausted = np.isneginf(scores[np.arange(len(best)), best])
+        return [ALPHABET[i] if not done else 'a' for i, done in zip(best, exhausted)]
+
+    def predict_next_letter(self, masked_word: str, wrong_guesses: Set[str]) -> str:
+        """Predict the next letter for one state (same interface as HangmanBot)"""
+        state = [(masked_word, wrong_guesses)]
+        X = self.encoder.encode_one(masked_word, wrong_guesses)
+        scores = self.letter_scores(X, self.encoder.guessed_mask(state))[0]
+        best = int(np.argmax(scores))
+        return ALPHABET[best] if not np.isneginf(scores[best]) else 'a'
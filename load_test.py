@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Hangman Web API Load Tester
+
+Drives realistic games against the Flask game API with many concurrent
+simulated players and reports throughput, per-endpoint latency percentiles
+and error rates.
+
+Usage:
+    python load_test.py --serve --clients 8 --duration 30
+    python load_test.py --url http://localhost:5000 --clients 16 --games 2000
+    python load_test.py --serve --save-baseline baseline.json
+    python load_test.py --serve --baseline baseline.json
+
+Each client keeps its own cookie session (the game state lives in the Flask
+session) and repeats POST /api/new_game followed by POST /api/guess until the
+game is over. With --serve, a local server (create_flask_app with the
+template bot) is started in-process on a free port, so no separate terminal
+is needed.
+
+--save-baseline stores the report as JSON; --baseline compares a run against
+a saved report and flags throughput drops and latency increases beyond
+--tolerance.
+"""
+
+import sys
+import json
+import time
+import argparse
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+ENDPOINTS = ('/api/new_game', '/api/guess')
+PERCENTILES = (50, 90, 95, 99)
+
+class LoadStats:
+    """Thread-safe latency and error counters per endpoint"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.games = 0
+        self.wins = 0
+
+    def record(self, endpoint, seconds, ok):
+        """Record one request"""
+        with self.lock:
+            self.latencies[endpoint].append(seconds)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def record_game(self, won):
+        """Record one finished game"""
+        with self.lock:
+            self.games += 1
+            self.wins += int(won)
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+def timed_post(session, stats, url, endpoint, params, timeout):
+    """
+    POST to an endpoint, recording latency and success
+
+    Returns:
+        dict: Parsed JSON response, or None if the request failed
+    """
+    start = time.perf_counter()
+    try:
+        response = session.post(url + endpoint, params=params, timeout=timeout)
+        data = response.json() if response.ok else None
+        ok = bool(data and data.get('success'))
+    except (requests.RequestException, ValueError):
+        data, ok = None, False
+    stats.record(endpoint, time.perf_counter() - start, ok)
+    return data if ok else None
+
+def run_client(url, stats, stop_at, games_left, bot=None, timeout=10.0):
+    """
+    One simulated player: play games back to back until time or games run out
+
+    Args:
+        url: Server base URL
+        stats: Shared LoadStats
+        stop_at: perf_counter() time to stop at (None = no time limit)
+        games_left: Shared game budget [remaining] (None = no game limit)
+        bot: Optional ?bot= variant name
+        timeout: Per-request timeout in seconds
+    """
+    params = {'bot': bot} if bot else None
+    with requests.Session() as session:
+        while stop_at is None or time.perf_counter() < stop_at:
+            if games_left is not None:
+                with stats.lock:
+                    if games_left[0] <= 0:
+                        return
+                    games_left[0] -= 1
+
+            data = timed_post(session, stats, url, '/api/new_game', params, timeout)
+            if data is None:
+                continue
+
+            # A game has at most 26 guesses; more means the server is misbehaving
+            for _ in range(26):
+                data = timed_post(session, stats, url, '/api/guess', params, timeout)
+                if data is None or data['game_state']['game_over']:
+                    break
+
+            if data is not None and data['game_state']['game_over']:
+                stats.record_game('_' not in data['game_state']['masked_word'])
+
+def run_load_test(url, clients=8, duration=None, games=None, bot=None, timeout=10.0):
+    """
+    Run the load test and build the report
+
+    Args:
+        url: Server base URL
+        clients: Number of concurrent players
+        duration: Seconds to run (used when games is None)
+        games: Total number of games to play
+        bot: Optional ?bot= variant name
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        dict: Report (see build_report)
+    """
+    stats = LoadStats()
+    if games is None and duration is None:
+        duration = 10.0
+    stop_at = time.perf_counter() + duration if games is None else None
+    games_left = [games] if games is not None else None
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as executor:
+        futures = [executor.submit(run_client, url, stats, stop_at, games_left, bot, timeout)
+                   for _ in range(clients)]
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - start
+
+    return build_report(stats, elapsed, clients)
+
+def build_report(stats, elapsed, clients):
+    """Aggregate LoadStats into a JSON-serializable report"""
+    endpoints = {}
+    total_requests = 0
+    total_errors = 0
+    for endpoint in ENDPOINTS:
+        latencies = sorted(stats.latencies.get(endpoint, []))
+        requests_made = len(latencies)
+        errors = stats.errors.get(endpoint, 0)
+        total_requests += requests_made
+        total_errors += errors
+        endpoints[endpoint] = {
+            'requests': requests_made,
+            'errors': errors,
+            'error_rate': (errors / requests_made) * 100 if requests_made else 0.0,
+            'mean_ms': (sum(latencies) / requests_made) * 1000 if requests_made else 0.0,
+            'percentiles_ms': {str(p): percentile(latencies, p) * 1000 for p in PERCENTILES},
+        }
+
+    return {
+        'clients': clients,
+        'seconds': elapsed,
+        'games': stats.games,
+        'win_rate': (stats.wins / stats.games) * 100 if stats.games else 0.0,
+        'requests': total_requests,
+        'errors': total_errors,
+        'error_rate': (total_errors / total_requests) * 100 if total_requests else 0.0,
+        'requests_per_second': total_requests / elapsed if elapsed else 0.0,
+        'games_per_second': stats.games / elapsed if elapsed else 0.0,
+        'endpoints': endpoints,
+    }
+
+def print_report(report):
+    """Print a load test report"""
+    print("\n" + "=" * 60)
+    print("LOAD TEST RESULTS")
+    print("=" * 60)
+    print(f"Clients: {report['clients']}")
+    print(f"Duration: {report['seconds']:.1f} seconds")
+    print(f"Games: {report['games']} ({report['games_per_second']:.1f}/s, {report['win_rate']:.1f}% won)")
+    print(f"Requests: {report['requests']} ({report['requests_per_second']:.1f}/s)")
+    print(f"Errors: {report['errors']} ({report['error_rate']:.2f}%)")
+
+    print("\nLatency by Endpoint (ms):")
+    print("-" * 60)
+    header = "".join(f"{'p' + str(p):>9}" for p in PERCENTILES)
+    print(f"{'Endpoint':<16}{'Requests':>9}{'Mean':>9}{header}{'Errors':>9}")
+    for endpoint, data in report['endpoints'].items():
+        values = "".join(f"{data['percentiles_ms'][str(p)]:>9.2f}" for p in PERCENTILES)
+        print(f"{endpoint:<16}{data['requests']:>9}{data['mean_ms']:>9.2f}{values}{data['errors']:>9}")
+
+def compare_to_baseline(report, baseline, tolerance=0.10):
+    """
+    Compare a report with a saved baseline
+
+    Args:
+        report: Current report
+        baseline: Saved report
+        tolerance: Allowed relative regression (0.10 = 10%)
+
+    Returns:
+        list: Regression messages (empty if none)
+    """
+    regressions = []
+
+    def check(label, current, previous, higher_is_better):
+        if not previous:
+            return
+        change = (current - previous) / previous
+        arrow = f"{previous:.2f} -> {current:.2f} ({change * 100:+.1f}%)"
+        regressed = change < -tolerance if higher_is_better else change > tolerance
+        print(f"{'REGRESSION' if regressed else 'ok':<11}{label}: {arrow}")
+        if regressed:
+            regressions.append(f"{label}: {arrow}")
+
+    print("\n" + "=" * 60)
+    print(f"COMPARISON WITH BASELINE (tolerance {tolerance:.0%})")
+    print("=" * 60)
+    check("requests/s", report['requests_per_second'], baseline.get('requests_per_second'), True)
+    for endpoint, data in report['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(endpoint)
+        if not previous:
+            continue
+        for p in ('50', '99'):
+            check(f"{endpoint} p{p} ms", data['percentiles_ms'][p], previous['percentiles_ms'].get(p), False)
+
+    if report['error_rate'] > baseline.get('error_rate', 0.0):
+        message = f"error rate: {baseline.get('error_rate', 0.0):.2f}% -> {report['error_rate']:.2f}%"
+        print(f"{'REGRESSION':<11}{message}")
+        regressions.append(message)
+    return regressions
+
+def start_local_server():
+    """Start create_flask_app with the template bot on a free port; return its URL"""
+    from werkzeug.serving import make_server
+    from user_template import HangmanBot, create_flask_app, load_training_words
+
+    app = create_flask_app(HangmanBot(load_training_words()))
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Load test the Hangman web API")
+    parser.add_argument('--url', default='http://localhost:5000', help="Server base URL")
+    parser.add_argument('--serve', action='store_true', help="Start a local server in-process instead of using --url")
+    parser.add_argument('--clients', type=int, default=8, help="Concurrent simulated players")
+    parser.add_argument('--duration', type=float, help="Seconds to run (default 10)")
+    parser.add_argument('--games', type=int, help="Total games to play (instead of --duration)")
+    parser.add_argument('--bot', help="Bot variant to play with (?bot=)")
+    parser.add_argument('--timeout', type=float, default=10.0, help="Per-request timeout in seconds")
+    parser.add_argument('--save-baseline', metavar='FILE', help="Save this run's report as a baseline")
+    parser.add_argument('--baseline', metavar='FILE', help="Compare against a saved baseline")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="Allowed relative regression")
+    return parser.parse_args()
+
+def main():
+    """Run a load test against the Hangman web API"""
+    args = parse_args()
+
+    print("Hangman Web API Load Tester")
+    print("=" * 40)
+
+    url = start_local_server() if args.serve else args.url.rstrip('/')
+    limit = f"{args.games} games" if args.games else f"{args.duration or 10.0:.0f} seconds"
+    print(f"Target: {url} | Clients: {args.clients} | Limit: {limit}")
+
+    report = run_load_test(url, args.clients, args.duration, args.games, args.bot, args.timeout)
+    print_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if compare_to_baseline(report, baseline, args.tolerance):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
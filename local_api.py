@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Hangman Bot Local Evaluation Server
+
+This script runs a self-contained evaluation service that speaks the same
+protocol as the official API, so you can iterate offline and load-test the
+submission flow without waiting on the remote queue.
+
+Usage:
+    python local_api.py
+    python local_api.py --port 8000 --workers 4 --timeout 300 --num-words 500
+
+Then point the API tester at it:
+    python test_api.py --api-url http://localhost:8000
+
+Endpoints:
+- POST /api/evaluate          multipart upload ('files', 'user_id', 'model_name')
+- GET  /api/status/<job_id>   job status and, once completed, the results
+
+Every job runs in its own worker process (at most --workers at once), so the
+uploaded module is loaded in isolation and a job that exceeds --timeout is
+killed without affecting the others. Unless --test-words is given, a held-out
+slice of training_words.txt is used as the test set and the bot is trained on
+the rest.
+"""
+
+import sys
+import time
+import uuid
+import queue
+import random
+import argparse
+import tempfile
+import threading
+import traceback
+import multiprocessing
+from pathlib import Path
+
+from flask import Flask, request, jsonify
+
+from bot_loader import load_bot_class
+
+DEFAULT_WORDS = ['python', 'machine', 'learning', 'algorithm', 'computer', 'hangman',
+                 'programming', 'artificial', 'intelligence', 'neural', 'network']
+
+def load_words(path):
+    """Load a word list (one word per line)"""
+    with open(path, 'r') as f:
+        return [line.strip().lower() for line in f if line.strip()]
+
+def split_words(training_words, num_words, seed):
+    """Hold out num_words of the corpus as a test set; return (train, test)"""
+    words = list(training_words)
+    random.Random(seed).shuffle(words)
+    return words[num_words:], words[:num_words]
+
+# =============================================================================
+# EVALUATION WORKER (runs in a child process)
+# =============================================================================
+
+def play_game(bot, word, max_lives=6):
+    """
+    Play one game and return its result
+
+    Invalid or repeated guesses cost a life, so a misbehaving bot cannot
+    loop forever.
+    """
+    masked_word = '_' * len(word)
+    wrong_guesses = set()
+    guessed = set()
+    lives = max_lives
+    guesses = 0
+
+    while lives > 0 and '_' in masked_word:
+        guess = bot.predict_next_letter(masked_word, set(wrong_guesses))
+        guesses += 1
+
+        if isinstance(guess, str) and len(guess) == 1 and guess not in guessed and guess in word:
+            masked_word = ''.join(c if c == guess else m for c, m in zip(word, masked_word))
+        else:
+            wrong_guesses.add(guess if isinstance(guess, str) else repr(guess))
+            lives -= 1
+        guessed.add(guess)
+
+    return {
+        'word': word,
+        'won': '_' not in masked_word,
+        'guesses': guesses,
+        'lives_left': lives,
+        'final_masked': masked_word
+    }
+
+def summarize_results(word_results):
+    """Build the 'results' payload returned by /api/status"""
+    games_played = len(word_results)
+    wins = sum(1 for r in word_results if r['won'])
+    total_guesses = sum(r['guesses'] for r in word_results)
+    win_rate = round((wins / games_played) * 100, 1) if games_played else 0.0
+
+    length_performance = {}
+    for result in word_results:
+        data = length_performance.setdefault(len(result['word']), {'total': 0, 'wins': 0})
+        data['total'] += 1
+        if result['won']:
+            data['wins'] += 1
+    for data in length_performance.values():
+        data['win_rate'] = round((data['wins'] / data['total']) * 100, 1)
+
+    return {
+        'performance': {
+            'games_played': games_played,
+            'wins': wins,
+            'losses': games_played - wins,
+            'win_rate': win_rate,
+            'avg_guesses': round(total_guesses / games_played, 1) if games_played else 0.0,
+            'total_guesses': total_guesses
+        },
+        'length_performance': length_performance,
+        'word_results': word_results,
+        # The official scoring formula is not public; locally the score is the win rate
+        'overall_score': round(win_rate)
+    }
+
+def evaluate_submission(source_path, training_words, test_words, result_queue):
+    """
+    Load the submitted bot in isolation, train it and play every test word
+
+    Runs in a fresh child process; the outcome is put on result_queue as
+    ('completed', results) or ('failed', error message).
+    """
+    try:
+        bot = load_bot_class(source_path)(training_words)
+        word_results = [play_game(bot, word) for word in test_words]
+        result_queue.put(('completed', summarize_results(word_results)))
+    except BaseException:
+        result_queue.put(('failed', traceback.format_exc(limit=5)))
+
+# =============================================================================
+# JOB QUEUE
+# =============================================================================
+
+class EvaluationQueue:
+    """Queue of evaluation jobs served by a bounded pool of worker processes"""
+
+    def __init__(self, training_words, test_words, workers=2, timeout=300):
+        self.training_words = training_words
+        self.test_words = test_words
+        self.workers = workers
+        self.timeout = timeout
+
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.pending = queue.Queue()
+        self.upload_dir = tempfile.mkdtemp(prefix='hangman_jobs_')
+        self.context = multiprocessing.get_context('spawn')
+
+        # One dispatcher thread per worker slot; each runs one child process at a time
+        for _ in range(workers):
+            threading.Thread(target=self._dispatch, daemon=True).start()
+
+    def submit(self, source, user_id, model_name):
+        """Queue an uploaded bot for evaluation and return its job ID"""
+        job_id = uuid.uuid4().hex
+        source_path = Path(self.upload_dir) / f"{job_id}.py"
+        source_path.write_bytes(source)
+
+        with self.lock:
+            self.jobs[job_id] = {
+                'job_id': job_id,
+                'user_id': user_id,
+                'model_name': model_name,
+                'status': 'queued',
+                'submitted_at': time.time()
+            }
+        self.pending.put((job_id, str(source_path)))
+        return job_id
+
+    def status(self, job_id):
+        """Return a copy of a job's record (None if unknown)"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def queue_length(self):
+        """Number of jobs waiting for a worker"""
+        return self.pending.qsize()
+
+    def _update(self, job_id, **fields):
+        with self.lock:
+            self.jobs[job_id].update(fields)
+
+    def _wait_for_result(self, process, result_queue):
+        """Wait for a child's outcome, giving up on timeout or if it dies silently"""
+        deadline = time.time() + self.timeout
+        while time.time() < deadline:
+            try:
+                return result_queue.get(timeout=min(0.5, max(0.0, deadline - time.time())))
+            except queue.Empty:
+                if not process.is_alive():
+                    try:
+                        return result_queue.get(timeout=1)
+                    except queue.Empty:
+                        return 'failed', f"Evaluation process exited with code {process.exitcode}"
+        return 'failed', f"Evaluation timed out after {self.timeout} seconds"
+
+    def _dispatch(self):
+        """Worker slot loop: run queued jobs one at a time in child processes"""
+        while True:
+            job_id, source_path = self.pending.get()
+            self._update(job_id, status='running', started_at=time.time())
+
+            result_queue = self.context.Queue()
+            process = self.context.Process(
+                target=evaluate_submission,
+                args=(source_path, self.training_words, self.test_words, result_queue),
+                daemon=True
+            )
+            process.start()
+
+            try:
+                status, payload = self._wait_for_result(process, result_queue)
+            finally:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+                Path(source_path).unlink(missing_ok=True)
+
+            if status == 'completed':
+                self._update(job_id, status='completed', results=payload, finished_at=time.time())
+            else:
+                self._update(job_id, status='failed', error=payload, finished_at=time.time())
+
+# =============================================================================
+# HTTP API
+# =============================================================================
+
+def create_api_app(evaluation_queue):
+    """Create the Flask app exposing /api/evaluate and /api/status"""
+
+    app = Flask(__name__)
+
+    @app.route('/api/evaluate', methods=['POST'])
+    def evaluate():
+        """Accept a bot upload and queue it for evaluation"""
+        upload = request.files.get('files')
+        if upload is None:
+            return jsonify({'error': "Missing 'files' upload"}), 400
+
+        user_id = request.form.get('user_id', 'test_user')
+        model_name = request.form.get('model_name', 'my_hangman_bot')
+        job_id = evaluation_queue.submit(upload.read(), user_id, model_name)
+
+        return jsonify({
+            'job_id': job_id,
+            'status': 'queued',
+            'message': 'Submission queued for local evaluation',
+            'estimated_time': f"queue position {evaluation_queue.queue_length()}",
+            'test_words': len(evaluation_queue.test_words)
+        })
+
+    @app.route('/api/status/<job_id>', methods=['GET'])
+    def status(job_id):
+        """Return a job's status (and results once completed)"""
+        job = evaluation_queue.status(job_id)
+        if job is None:
+            return jsonify({'error': 'Unknown job ID'}), 404
+        return jsonify(job)
+
+    return app
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+
+def main():
+    """Start the local evaluation server"""
+    parser = argparse.ArgumentParser(description="Local Hangman evaluation server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=max(1, (multiprocessing.cpu_count() or 2) - 1),
+                        help="Maximum number of jobs evaluated concurrently")
+    parser.add_argument('--timeout', type=float, default=300, help="Per-job timeout in seconds")
+    parser.add_argument('--training-words', default='training_words.txt')
+    parser.add_argument('--test-words', help="Test word file (default: held-out training words)")
+    parser.add_argument('--num-words', type=int, default=100, help="Number of held-out test words")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("Hangman Local Evaluation Server")
+    print("=" * 40)
+
+    try:
+        training_words = load_words(args.training_words)
+    except FileNotFoundError:
+        print(f"{args.training_words} not found. Using sample words.")
+        training_words = DEFAULT_WORDS * 100
+
+    if args.test_words:
+        test_words = load_words(args.test_words)
+    else:
+        training_words, test_words = split_words(training_words, args.num_words, args.seed)
+
+    print(f"Training words: {len(training_words)}")
+    print(f"Test words: {len(test_words)}")
+    print(f"Workers: {args.workers} | Timeout: {args.timeout}s")
+
+    evaluation_queue = EvaluationQueue(training_words, test_words, args.workers, args.timeout)
+    app = create_api_app(evaluation_queue)
+    app.run(host=args.host, port=args.port, debug=False, threaded=True)
+
+if __name__ == "__main__":
+    sys.exit(main())
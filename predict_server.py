@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Hangman Bot JSON-Lines Prediction Server
+
+Loads a bot once and answers prediction requests over stdin/stdout, one JSON
+object per line, so external harnesses can share one warm model instead of
+importing and training the bot themselves.
+
+Usage:
+    python predict_server.py --bot python
+    python predict_server.py --artifact artifacts/python.pkl
+    echo '{"id": 1, "masked_word": "h_ll_", "wrong_guesses": ["x"]}' | python predict_server.py
+
+Requests (one per line):
+    {"id": 1, "masked_word": "h_ll_", "wrong_guesses": ["x"]}
+    {"id": 2, "states": [{"masked_word": "_a_", "wrong_guesses": []}, ...]}
+    Optional: "deadline_ms" (passed on to bots that support it)
+
+Responses (one per line, in request order):
+    {"id": 1, "letter": "e", "elapsed_ms": 0.21}
+    {"id": 2, "letters": ["t", ...], "elapsed_ms": 1.30}
+    {"id": 3, "error": "..."}
+
+The first line written is {"ready": true, ...} once the bot is loaded.
+Requests can be pipelined: write as many as you like without waiting, and
+match the answers by id. Anything the bot prints goes to stderr, so stdout
+only ever carries protocol lines.
+"""
+
+import sys
+import json
+import time
+import inspect
+import functools
+import argparse
+import contextlib
+
+from bot_loader import load_bot_class, load_bot_artifact
+
+def load_bot(bot_file=None, artifact=None, training_file='training_words.txt'):
+    """
+    Train a bot from a bot file, or load a saved artifact (see save_bot_artifact)
+
+    Returns:
+        tuple: (bot, description)
+    """
+    if artifact:
+        return load_bot_artifact(artifact), f"artifact {artifact}"
+
+    with open(training_file, 'r') as f:
+        training_words = [line.strip() for line in f if line.strip()]
+    return load_bot_class(bot_file)(training_words), bot_file
+
+@functools.lru_cache(maxsize=None)
+def accepts_deadline(bot_class):
+    """Whether the bot class's predict_next_letter takes a deadline_ms argument"""
+    try:
+        parameters = inspect.signature(bot_class.predict_next_letter).parameters
+    except (TypeError, ValueError):
+        return False
+    return 'deadline_ms' in parameters or any(
+        parameter.kind is inspect.Parameter.VAR_KEYWORD for parameter in parameters.values())
+
+def predict(bot, state, deadline_ms=None):
+    """Predict one letter for a {"masked_word", "wrong_guesses"} state"""
+    masked_word = state['masked_word']
+    wrong_guesses = set(state.get('wrong_guesses', []))
+    # Bots without a deadline_ms parameter get as long as they need
+    if deadline_ms is not None and accepts_deadline(type(bot)):
+        return bot.predict_next_letter(masked_word, wrong_guesses, deadline_ms=deadline_ms)
+    return bot.predict_next_letter(masked_word, wrong_guesses)
+
+def handle_request(bot, request):
+    """
+    Answer one decoded request
+
+    Returns:
+        dict: Response (without the request id and timing)
+    """
+    deadline_ms = request.get('deadline_ms')
+
+    if 'states' in request:
+        states = request['states']
+        # Bots with a batch path (e.g. letter_model.LetterModelBot) score all states at once
+        if hasattr(bot, 'predict_batch') and (deadline_ms is None or not accepts_deadline(type(bot))):
+            letters = bot.predict_batch([(s['masked_word'], set(s.get('wrong_guesses', []))) for s in states])
+        else:
+            letters = [predict(bot, state, deadline_ms) for state in states]
+        return {'letters': list(letters)}
+
+    if 'masked_word' in request:
+        return {'letter': predict(bot, request, deadline_ms)}
+
+    raise ValueError("Request needs 'masked_word' or 'states'")
+
+def serve(bot, input_stream, output_stream):
+    """
+    Answer requests from input_stream until it is closed
+
+    Returns:
+        dict: Number of requests, errors and states answered
+    """
+    stats = {'requests': 0, 'errors': 0, 'states': 0}
+
+    for line in input_stream:
+        line = line.strip()
+        if not line:
+            continue
+
+        start = time.perf_counter()
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            request_id = request.get('id')
+            response = handle_request(bot, request)
+            stats['states'] += len(response['letters']) if 'letters' in response else 1
+        except Exception as e:
+            response = {'error': f"{type(e).__name__}: {e}"}
+            stats['errors'] += 1
+
+        stats['requests'] += 1
+        response = {'id': request_id, **response,
+                    'elapsed_ms': round((time.perf_counter() - start) * 1000, 3)}
+        output_stream.write(json.dumps(response) + '\n')
+        output_stream.flush()
+
+    return stats
+
+def main():
+    """Load the bot and serve predictions over stdin/stdout"""
+    parser = argparse.ArgumentParser(description="JSON-lines Hangman prediction server (stdin/stdout)")
+    parser.add_argument('--bot', default='user_template.py', help="Bot file defining HangmanBot")
+    parser.add_argument('--artifact', help="Saved bot artifact (.pkl) to load instead of training")
+    parser.add_argument('--training-words', default='training_words.txt')
+    args = parser.parse_args()
+
+    # stdout carries the protocol only; bot output goes to stderr
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        bot, description = load_bot(args.bot, args.artifact, args.training_words)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    sys.stdout.write(json.dumps({'ready': True, 'bot': description, 'load_ms': round(load_ms, 1)}) + '\n')
+    sys.stdout.flush()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        stats = serve(bot, sys.stdin, sys.__stdout__)
+    elapsed = time.perf_counter() - start
+
+    print(f"Served {stats['requests']} requests ({stats['states']} states, {stats['errors']} errors) "
+          f"in {elapsed:.1f} seconds", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
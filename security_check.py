@@ -4,10 +4,23 @@ Security Check Script for Hangman ML Challenge Repository
 
 This script helps identify potential security issues in the repository.
 Run this before committing any changes to ensure the repository remains secure.
+
+Usage:
+    python security_check.py                  # full scan
+    python security_check.py --incremental    # reuse cached results for unchanged files
+    python security_check.py --staged         # only files staged for commit (pre-commit hook)
+    python security_check.py --changed        # only files changed since HEAD (plus untracked)
 """
 
+import os
 import re
 import sys
+import json
+import hashlib
+import argparse
+import subprocess
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Patterns that might indicate security issues
@@ -45,9 +58,20 @@ SECURITY_PATTERNS = {
 # Files to check
 FILES_TO_CHECK = ['.py', '.md', '.txt', '.json', '.yaml', '.yml', '.toml', '.cfg', '.ini']
 
+# Directories to skip entirely (pruned during the walk)
+IGNORE_DIRS = {
+    '.git',
+    '__pycache__',
+}
+
+# Cache of per-file results used by --incremental
+CACHE_FILE = '.security_check_cache.json'
+CACHE_VERSION = 1
+
 # Files to ignore
 IGNORE_FILES = {
     'security_check.py',  # This file itself
+    CACHE_FILE,
     '.gitignore',
     'SECURITY.md',
     'training_words.txt',  # Contains words that might match patterns
@@ -59,63 +83,279 @@ IGNORE_PATTERNS_IN_FILES = {
     # No special exceptions needed
 }
 
-def check_file_security(file_path):
-    """Check a single file for security issues"""
+# Scan files in a process pool once there are at least this many of them
+PARALLEL_THRESHOLD = 32
+
+def _single_line(pattern):
+    """Rewrite a pattern so it can never match across a newline"""
+    return pattern.replace('[^', '[^\\n').replace('\\s*', '[^\\S\\n]*')
+
+# Every pattern compiled once, individually (to report exact matches) ...
+COMPILED_PATTERNS = {
+    category: [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in patterns]
+    for category, patterns in SECURITY_PATTERNS.items()
+}
+
+# ... and as one alternation, used to find candidate lines in a single pass
+# over the whole file buffer. The groups are non-capturing and ASCII buffers are
+# lowercased instead of using IGNORECASE, so the regex engine can skip ahead on
+# the patterns' literal first characters.
+_ALTERNATION = '|'.join(
+    f'(?:{_single_line(pattern)})'
+    for patterns in SECURITY_PATTERNS.values()
+    for pattern in patterns
+)
+COMBINED_PATTERN = re.compile(_ALTERNATION)
+COMBINED_PATTERN_IGNORECASE = re.compile(_ALTERNATION, re.IGNORECASE)
+
+def read_staged(file_path):
+    """Raw content of a file as staged in the git index"""
+    return subprocess.run(['git', 'show', f':./{file_path.as_posix()}'],
+                          capture_output=True, check=True).stdout
+
+def check_file_security(file_path, staged=False):
+    """
+    Check a single file for security issues
+
+    Args:
+        file_path: File to check
+        staged: Check the version staged for commit instead of the working copy
+    """
     issues = []
     
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-            lines = content.split('\n')
-            
-            for line_num, line in enumerate(lines, 1):
-                for category, patterns in SECURITY_PATTERNS.items():
-                    # Check if this category should be ignored for this file
-                    file_name = file_path.name if hasattr(file_path, 'name') else str(file_path)
-                    if file_name in IGNORE_PATTERNS_IN_FILES and category in IGNORE_PATTERNS_IN_FILES[file_name]:
-                        continue
-                    
-                    for pattern in patterns:
-                        if re.search(pattern, line, re.IGNORECASE):
-                            issues.append({
-                                'file': file_path,
-                                'line': line_num,
-                                'category': category,
-                                'content': line.strip(),
-                                'pattern': pattern
-                            })
-    except (IOError, UnicodeDecodeError) as e:
+        if staged:
+            content = read_staged(file_path).decode('utf-8', errors='ignore')
+        else:
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+    except (IOError, UnicodeDecodeError, subprocess.CalledProcessError) as e:
         print(f"Error reading {file_path}: {e}")
+        return issues
+    
+    # Find the lines with at least one match in a single pass over the buffer,
+    # skipping to the next line as soon as a line is known to match
+    if content.isascii():
+        buffer, combined = content.lower(), COMBINED_PATTERN
+    else:
+        buffer, combined = content, COMBINED_PATTERN_IGNORECASE
+    
+    candidate_lines = []
+    line_num, pos = 1, 0
+    match = combined.search(buffer)
+    while match:
+        line_num += buffer.count('\n', pos, match.start())
+        candidate_lines.append(line_num)
+        pos = buffer.find('\n', match.start())
+        if pos == -1:
+            break
+        match = combined.search(buffer, pos + 1)
+    
+    if not candidate_lines:
+        return issues
+    
+    # Categories that should be ignored for this file
+    file_name = file_path.name if hasattr(file_path, 'name') else str(file_path)
+    ignored_categories = IGNORE_PATTERNS_IN_FILES.get(file_name, ())
+    
+    # Report every pattern that matches each candidate line
+    lines = content.split('\n')
+    for line_num in candidate_lines:
+        line = lines[line_num - 1]
+        for category, patterns in COMPILED_PATTERNS.items():
+            if category in ignored_categories:
+                continue
+            
+            for pattern, regex in patterns:
+                if regex.search(line):
+                    issues.append({
+                        'file': file_path,
+                        'line': line_num,
+                        'category': category,
+                        'content': line.strip(),
+                        'pattern': pattern
+                    })
     
     return issues
 
-def main():
+def should_check(file_path):
+    """Whether a file is eligible for scanning"""
+    if file_path.name in IGNORE_FILES:
+        return False
+    if any(part in IGNORE_DIRS for part in file_path.parts):
+        return False
+    return file_path.suffix.lower() in FILES_TO_CHECK
+
+def find_files(root='.'):
+    """Walk the tree, pruning ignored directories, and return the files to check"""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in IGNORE_DIRS]
+        for name in filenames:
+            file_path = Path(dirpath, name)
+            if should_check(file_path):
+                files.append(file_path)
+    return files
+
+def git_changed_files(staged=False):
+    """
+    Files changed according to git, relative to the current directory
+
+    Args:
+        staged: Only the files staged for commit; otherwise every file changed
+            since HEAD plus untracked (non-ignored) files
+
+    Returns:
+        list: Eligible files (None if git is unavailable); with staged they are
+            only guaranteed to exist in the index, not in the working tree
+    """
+    if staged:
+        commands = [['git', 'diff', '--cached', '--name-only', '--relative', '--diff-filter=d']]
+    else:
+        commands = [['git', 'diff', 'HEAD', '--name-only', '--relative', '--diff-filter=d'],
+                    ['git', 'ls-files', '--others', '--exclude-standard']]
+    
+    names = []
+    for command in commands:
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Could not list changed files with git: {e}")
+            return None
+        names.extend(line for line in output.splitlines() if line)
+    
+    files = []
+    for name in dict.fromkeys(names):
+        file_path = Path(name)
+        if (staged or file_path.is_file()) and should_check(file_path):
+            files.append(file_path)
+    return files
+
+def scan_files(files, staged=False):
+    """Scan files (in parallel for larger sets); return one issue list per file"""
+    if len(files) >= PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as executor:
+            chunksize = max(1, len(files) // (4 * (os.cpu_count() or 1)))
+            return list(executor.map(check_file_security, files, repeat(staged), chunksize=chunksize))
+    return [check_file_security(file_path, staged) for file_path in files]
+
+def _rules_signature():
+    """Hash of the scanning rules; cached results are discarded when it changes"""
+    rules = json.dumps([CACHE_VERSION, SECURITY_PATTERNS,
+                        {name: sorted(categories) for name, categories in IGNORE_PATTERNS_IN_FILES.items()}],
+                       sort_keys=True)
+    return hashlib.sha256(rules.encode()).hexdigest()
+
+def load_cache(cache_path):
+    """Load cached per-file results (empty if missing, unreadable or stale)"""
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+    except (IOError, ValueError):
+        return {}
+    if cache.get('rules') != _rules_signature():
+        return {}
+    return cache.get('files', {})
+
+def save_cache(cache_path, entries):
+    """Write per-file results back to the cache"""
+    with open(cache_path, 'w') as f:
+        json.dump({'rules': _rules_signature(), 'files': entries}, f)
+
+def scan_incremental(files, cache_path, staged=False):
+    """
+    Scan files, reusing cached results for files that have not changed
+
+    A file whose size and mtime match its cache entry is skipped without being
+    read; one whose stat changed but whose content hash did not is not rescanned.
+    With staged, the staged content is always hashed, since the working copy's
+    stat says nothing about the index.
+
+    Returns:
+        tuple: (issue lists, one per file, number of files actually rescanned)
+    """
+    cache = load_cache(cache_path)
+    results = {}
+    stats = {}
+    to_scan = []
+    
+    for file_path in files:
+        key = str(file_path)
+        entry = cache.get(key)
+        try:
+            if staged:
+                content = read_staged(file_path)
+                stat = {'size': len(content), 'mtime_ns': None}
+            else:
+                file_stat = file_path.stat()
+                stat = {'size': file_stat.st_size, 'mtime_ns': file_stat.st_mtime_ns}
+                if entry and entry['size'] == stat['size'] and entry['mtime_ns'] == stat['mtime_ns']:
+                    results[key] = entry['issues']
+                    stats[key] = entry
+                    continue
+                with open(file_path, 'rb') as f:
+                    content = f.read()
+        except (OSError, subprocess.CalledProcessError):
+            continue
+        
+        content_hash = hashlib.sha256(content).hexdigest()
+        stats[key] = dict(stat, sha256=content_hash)
+        if entry and entry['sha256'] == content_hash:
+            results[key] = entry['issues']
+        else:
+            to_scan.append(file_path)
+    
+    for file_path, issues in zip(to_scan, scan_files(to_scan, staged)):
+        results[str(file_path)] = [
+            {k: v for k, v in issue.items() if k != 'file'} for issue in issues
+        ]
+    
+    # Keep entries for files outside this run (e.g. a --staged subset)
+    for key, issues in results.items():
+        cache[key] = dict(stats[key], issues=issues)
+    save_cache(cache_path, cache)
+    
+    issue_lists = [
+        [dict(issue, file=file_path) for issue in results[str(file_path)]]
+        for file_path in files if str(file_path) in results
+    ]
+    return issue_lists, len(to_scan)
+
+def main(argv=None):
     """Main security check function"""
+    parser = argparse.ArgumentParser(description="Scan the repository for potential security issues")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Reuse cached results for files that have not changed")
+    parser.add_argument('--staged', action='store_true', help="Only check files staged for commit")
+    parser.add_argument('--changed', action='store_true',
+                        help="Only check files changed since HEAD (plus untracked files)")
+    parser.add_argument('--cache-file', default=CACHE_FILE, help="Cache location for --incremental")
+    args = parser.parse_args(argv)
+    
     print("Hangman ML Challenge - Security Check")
     print("=" * 50)
     
-    issues_found = []
-    files_checked = 0
+    # Collect all relevant files
+    if args.staged or args.changed:
+        files_to_scan = git_changed_files(staged=args.staged)
+        if files_to_scan is None:
+            return 1
+    else:
+        files_to_scan = find_files()
+    
+    files_checked = len(files_to_scan)
     
-    # Check all relevant files
-    for file_path in Path('.').rglob('*'):
-        if file_path.is_file():
-            # Skip ignored files
-            if file_path.name in IGNORE_FILES:
-                continue
-            
-            # Skip files in .git directory
-            if '.git' in file_path.parts:
-                continue
-            
-            # Check file extension
-            if file_path.suffix.lower() in FILES_TO_CHECK:
-                files_checked += 1
-                issues = check_file_security(file_path)
-                issues_found.extend(issues)
+    # Scan them (reusing cached results for unchanged files when incremental)
+    if args.incremental:
+        issue_lists, files_rescanned = scan_incremental(files_to_scan, args.cache_file, args.staged)
+    else:
+        issue_lists, files_rescanned = scan_files(files_to_scan, args.staged), files_checked
+    issues_found = [issue for issues in issue_lists for issue in issues]
     
     # Report results
     print(f"Files checked: {files_checked}")
+    if args.incremental:
+        print(f"Files rescanned: {files_rescanned}")
     print(f"Security issues found: {len(issues_found)}")
     print()
     
@@ -7,27 +7,156 @@ received the API URL and credentials from the admin.
 
 Usage:
     python test_api.py
+    python test_api.py --api-url http://localhost:8000 --user-id me
+    python test_api.py --api-url http://localhost:8000 --verify --force
+    python test_api.py --api-url http://localhost:8000 \
+        --variant baseline=user_template.py --variant tuned=my_bot.py
 
 The script will:
 1. Load your HangmanBot from user_template.py
 2. Submit it to the API for evaluation
 3. Monitor the evaluation progress
 4. Display detailed results and performance metrics
+
+With one or more --variant options, every variant is submitted concurrently
+and all jobs are monitored together, followed by a side-by-side comparison.
+
+Submissions are cached by file content: re-submitting an unchanged bot to the
+same API reuses the previous job's results (use --force to re-upload anyway).
 """
 
 import sys
 import time
+import random
+import hashlib
+import argparse
+import threading
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from bot_loader import load_bot_class
+
+# Polling backoff (seconds): start fast, back off exponentially on long queues
+POLL_INITIAL_DELAY = 0.5
+POLL_MAX_DELAY = 15.0
+POLL_BACKOFF_FACTOR = 2.0
+
+def create_session(retries=3, pool_size=10):
+    """
+    Create a pooled HTTP session with automatic retries
+
+    Args:
+        retries: Number of retries for connection errors and 429/5xx responses
+        pool_size: Maximum number of keep-alive connections per host
+
+    Returns:
+        requests.Session: Session shared by every API call
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
 
-# Import the HangmanBot from user_template
-try:
-    from user_template import HangmanBot
-except ImportError:
-    print("Error: Could not import HangmanBot from user_template.py")
-    print("Make sure user_template.py is in the same directory.")
-    sys.exit(1)
+def next_poll_delay(delay):
+    """
+    Compute the next polling delay using exponential backoff with jitter
+
+    Args:
+        delay: Current (un-jittered) delay in seconds
+
+    Returns:
+        tuple: (seconds to sleep now, next un-jittered delay)
+    """
+    sleep_for = random.uniform(delay / 2, delay)
+    return sleep_for, min(delay * POLL_BACKOFF_FACTOR, POLL_MAX_DELAY)
+
+# Local cache of submissions -> job IDs (per API URL), keyed by
+# submission_key: the same file under another user or model name is a new job
+SUBMISSION_CACHE_FILE = Path('.submission_cache.json')
+_cache_lock = threading.Lock()
+
+# Words used by the --verify smoke check (no full training pass needed)
+SMOKE_TEST_WORDS = ['python', 'machine', 'learning', 'algorithm', 'computer', 'hangman']
+
+def hash_file(file_path):
+    """Return the SHA-256 hex digest of a file's content"""
+    with open(file_path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def submission_key(content_hash, user_id, model_name):
+    """Cache key of one submission: file content plus the name it is submitted under"""
+    return f"{user_id}/{model_name}/{content_hash}"
+
+def load_submission_cache():
+    """Load the content-hash -> job-ID cache (empty if missing or unreadable)"""
+    try:
+        with open(SUBMISSION_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def remember_submission(api_url, key, job_id):
+    """Record a successful submission (see submission_key) in the local cache"""
+    with _cache_lock:
+        cache = load_submission_cache()
+        cache.setdefault(api_url, {})[key] = job_id
+        with open(SUBMISSION_CACHE_FILE, 'w') as f:
+            json.dump(cache, f, indent=2)
+
+def verify_bot(file_path):
+    """
+    Fast local smoke check of a bot file before uploading it
+
+    Loads HangmanBot from the file, trains it on a handful of words and plays
+    a few games, checking that every guess is a single new letter.
+
+    Args:
+        file_path: Path of the bot file to check
+
+    Returns:
+        bool: True if the bot passed the smoke check
+    """
+    print(f"Verifying {file_path}...")
+    try:
+        bot = load_bot_class(file_path)(SMOKE_TEST_WORDS)
+        
+        for word in SMOKE_TEST_WORDS:
+            masked_word = '_' * len(word)
+            wrong_guesses = set()
+            guessed = set()
+            
+            while len(wrong_guesses) < 6 and '_' in masked_word:
+                guess = bot.predict_next_letter(masked_word, set(wrong_guesses))
+                if not isinstance(guess, str) or len(guess) != 1 or not guess.isalpha():
+                    print(f" Verification failed: invalid guess {guess!r} for {masked_word}")
+                    return False
+                if guess in guessed:
+                    print(f" Verification failed: repeated guess '{guess}' for {masked_word}")
+                    return False
+                guessed.add(guess)
+                
+                if guess in word:
+                    masked_word = ''.join(c if c == guess else m for c, m in zip(word, masked_word))
+                else:
+                    wrong_guesses.add(guess)
+    except Exception as e:
+        print(f" Verification failed: {type(e).__name__}: {e}")
+        return False
+    
+    print(" Verification passed")
+    return True
 
 def get_api_config():
     """Get API configuration from user"""
@@ -56,47 +185,52 @@ def get_api_config():
     return {
         'api_url': api_url,
         'user_id': user_id,
-        'model_name': model_name
+        'model_name': model_name,
+        'session': create_session(),
+        'verify': False,
+        'use_cache': True
     }
 
-def submit_bot_to_api(config):
+def submit_bot_to_api(config, file_path='user_template.py', model_name=None):
     """Submit the bot to the API for evaluation"""
     print("\nSubmitting bot to API...")
     print("=" * 30)
     
-    # Load training data
-    try:
-        with open('training_words.txt', 'r') as f:
-            training_words = [line.strip() for line in f if line.strip()]
-        print(f"Loaded {len(training_words)} training words")
-    except FileNotFoundError:
-        print("training_words.txt not found. Using sample words.")
-        training_words = ['python', 'machine', 'learning', 'algorithm', 'computer'] * 1000
+    # Optional local smoke check (the API does the real training and evaluation)
+    if config.get('verify') and not verify_bot(file_path):
+        return None
     
-    # Create bot
-    print("Initializing HangmanBot...")
-    bot = HangmanBot(training_words)
+    try:
+        content_hash = hash_file(file_path)
+    except OSError as e:
+        print(f" Cannot read {file_path}: {e}")
+        return None
     
     # Prepare submission
-    files = {
-        'files': ('user_template.py', open('user_template.py', 'rb'), 'text/plain')
-    }
-    
     data = {
         'user_id': config['user_id'],
-        'model_name': config['model_name']
+        'model_name': model_name or config['model_name']
     }
     
+    # Reuse the previous job if this exact file was already submitted under the same name
+    cache_key = submission_key(content_hash, data['user_id'], data['model_name'])
+    if config.get('use_cache', True):
+        cached_job_id = load_submission_cache().get(config['api_url'], {}).get(cache_key)
+        if cached_job_id:
+            status_data = check_job_status(config, cached_job_id)
+            if status_data and status_data.get('status') in ['queued', 'running', 'completed']:
+                print(f" Unchanged {file_path} already submitted, reusing job {cached_job_id}")
+                return cached_job_id
+    
     try:
         # Submit to API
-        response = requests.post(
-            f"{config['api_url']}/api/evaluate",
-            files=files,
-            data=data,
-            timeout=30
-        )
-        
-        files['files'][1].close()  # Close the file
+        with open(file_path, 'rb') as f:
+            response = config['session'].post(
+                f"{config['api_url']}/api/evaluate",
+                files={'files': ('user_template.py', f, 'text/plain')},
+                data=data,
+                timeout=30
+            )
         
         if response.status_code == 200:
             result = response.json()
@@ -106,6 +240,8 @@ def submit_bot_to_api(config):
             print(f"Message: {result.get('message', 'N/A')}")
             print(f"Estimated Time: {result.get('estimated_time', 'N/A')}")
             print(f"Test Words: {result.get('test_words', 'N/A')}")
+            if result.get('job_id'):
+                remember_submission(config['api_url'], cache_key, result['job_id'])
             return result.get('job_id')
         else:
             print(f" Submission failed!")
@@ -120,7 +256,7 @@ def submit_bot_to_api(config):
 def check_job_status(config, job_id):
     """Check the status of a job"""
     try:
-        response = requests.get(
+        response = config['session'].get(
             f"{config['api_url']}/api/status/{job_id}",
             timeout=10
         )
@@ -142,6 +278,7 @@ def wait_for_completion(config, job_id):
     
     start_time = time.time()
     last_status = None
+    delay = POLL_INITIAL_DELAY
     
     while True:
         status_data = check_job_status(config, job_id)
@@ -152,10 +289,11 @@ def wait_for_completion(config, job_id):
         
         current_status = status_data.get('status', 'unknown')
         
-        # Show status change
+        # Show status change (and poll quickly again right after one)
         if current_status != last_status:
             print(f"Status: {current_status}")
             last_status = current_status
+            delay = POLL_INITIAL_DELAY
         
         if current_status == 'completed':
             elapsed = time.time() - start_time
@@ -167,10 +305,114 @@ def wait_for_completion(config, job_id):
         elif current_status in ['queued', 'running']:
             # Show progress dots
             print(".", end="", flush=True)
-            time.sleep(5)  # Check every 5 seconds
         else:
             print(f"Unknown status: {current_status}")
-            time.sleep(5)
+        
+        sleep_for, delay = next_poll_delay(delay)
+        time.sleep(sleep_for)
+
+def submit_variants(config, variants):
+    """
+    Submit several model variants concurrently
+
+    Args:
+        config: API configuration
+        variants: Dict of model name -> path of the bot file to upload
+
+    Returns:
+        dict: Model name -> job ID (None if the submission failed)
+    """
+    if not variants:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+        futures = {
+            name: executor.submit(submit_bot_to_api, config, path, name)
+            for name, path in variants.items()
+        }
+        jobs = {}
+        for name, future in futures.items():
+            # One broken variant must not lose the jobs the others submitted
+            try:
+                jobs[name] = future.result()
+            except Exception as e:
+                print(f"[{name}] Submission error: {type(e).__name__}: {e}")
+                jobs[name] = None
+        return jobs
+
+def wait_for_all(config, jobs):
+    """
+    Monitor several jobs from one polling loop until every job finishes
+
+    Args:
+        config: API configuration
+        jobs: Dict of model name -> job ID
+
+    Returns:
+        dict: Model name -> final status data (None if it could not be fetched)
+    """
+    if not jobs:
+        return {}
+    
+    print(f"\nMonitoring {len(jobs)} jobs...")
+    print("=" * 40)
+    
+    start_time = time.time()
+    pending = dict(jobs)
+    finished = {}
+    last_status = {}
+    delay = POLL_INITIAL_DELAY
+    
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        while pending:
+            names = list(pending)
+            statuses = executor.map(lambda name: check_job_status(config, pending[name]), names)
+            
+            changed = False
+            for name, status_data in zip(names, statuses):
+                if not status_data:
+                    print(f"[{name}] Failed to check job status")
+                    pending.pop(name)
+                    finished[name] = None
+                    continue
+                
+                current_status = status_data.get('status', 'unknown')
+                if current_status != last_status.get(name):
+                    print(f"[{name}] Status: {current_status} ({time.time() - start_time:.1f}s)")
+                    last_status[name] = current_status
+                    changed = True
+                
+                if current_status in ['completed', 'failed']:
+                    pending.pop(name)
+                    finished[name] = status_data
+            
+            if not pending:
+                break
+            
+            if changed:
+                delay = POLL_INITIAL_DELAY
+            sleep_for, delay = next_poll_delay(delay)
+            time.sleep(sleep_for)
+    
+    print(f"All jobs finished in {time.time() - start_time:.1f} seconds")
+    return finished
+
+def print_variant_comparison(results):
+    """Print a side-by-side summary of several evaluated variants"""
+    print("\n" + "=" * 60)
+    print("VARIANT COMPARISON")
+    print("=" * 60)
+    print(f"{'Model':<20} {'Status':<12} {'Win Rate':>10} {'Avg Guesses':>12} {'Score':>8}")
+    print("-" * 66)
+    
+    for name, status_data in results.items():
+        status_data = status_data or {}
+        results_data = status_data.get('results', {})
+        perf = results_data.get('performance', {})
+        print(f"{name:<20} {status_data.get('status', 'error'):<12} "
+              f"{str(perf.get('win_rate', 'N/A')):>10} "
+              f"{str(perf.get('avg_guesses', 'N/A')):>12} "
+              f"{str(results_data.get('overall_score', 'N/A')):>8}")
 
 def print_api_results(status_data):
     """Print detailed API results"""
@@ -246,6 +488,20 @@ def print_api_results(status_data):
         else:
             print("\n Consider improving your bot's algorithm before resubmitting")
 
+def parse_args():
+    """Parse command line options (anything omitted is asked for interactively)"""
+    parser = argparse.ArgumentParser(description="Submit your HangmanBot to the evaluation API")
+    parser.add_argument('--api-url', help="API URL provided by the admin (or a local server)")
+    parser.add_argument('--user-id', default='test_user', help="Your user ID")
+    parser.add_argument('--model-name', default='my_hangman_bot', help="Model name for a single submission")
+    parser.add_argument('--variant', action='append', default=[], metavar='NAME=PATH',
+                        help="Submit a model variant; repeat to evaluate several concurrently")
+    parser.add_argument('--verify', action='store_true',
+                        help="Run a fast local smoke check of the bot before uploading")
+    parser.add_argument('--force', action='store_true',
+                        help="Re-upload even if an unchanged file was already submitted")
+    return parser.parse_args()
+
 def main():
     """Main API testing function"""
     print("Hangman Bot API Tester")
@@ -254,8 +510,40 @@ def main():
     print("Make sure you have received API access from the admin first!")
     print()
     
+    args = parse_args()
+    
     # Get API configuration
-    config = get_api_config()
+    if args.api_url:
+        config = {
+            'api_url': args.api_url.rstrip('/'),
+            'user_id': args.user_id,
+            'model_name': args.model_name,
+            'session': create_session(pool_size=max(10, len(args.variant)))
+        }
+    else:
+        config = get_api_config()
+    config['verify'] = args.verify
+    config['use_cache'] = not args.force
+    
+    # Submit and monitor several variants at once
+    if args.variant:
+        variants = {}
+        for spec in args.variant:
+            name, sep, path = spec.partition('=')
+            if not sep or not name or not path:
+                print(f"Error: invalid --variant '{spec}' (expected NAME=PATH)")
+                sys.exit(1)
+            variants[name] = path
+        
+        jobs = submit_variants(config, variants)
+        failed = [name for name, job_id in jobs.items() if not job_id]
+        for name in failed:
+            print(f" Failed to submit variant {name}")
+        
+        results = wait_for_all(config, {name: job_id for name, job_id in jobs.items() if job_id})
+        results.update({name: None for name in failed})
+        print_variant_comparison(results)
+        return
     
     # Submit bot
     job_id = submit_bot_to_api(config)
@@ -7,21 +7,54 @@ without needing to use the web interface. Perfect for quick testing and validati
 
 Usage:
     python test_bot.py
+    python test_bot.py --compare user_template.py python --confidence 0.95 --max-games 2000
+    python test_bot.py --trace games.trace
+    python test_bot.py --num-tests 100000 --export results.parquet
+    python test_bot.py --memory-report python
+    python test_bot.py --profile python --line-timing
 
 The script will:
 1. Load your HangmanBot from user_template.py
 2. Test it on sample words
 3. Calculate win rate and performance metrics
 4. Display detailed results
+
+With --compare, two bot files are played on the same words (stratified by
+word length) until the difference in win rate is statistically decided at the
+requested confidence, or the game budget runs out.
+
+With --trace, every guess (letter, hit/miss, latency) is streamed to a compact
+binary trace file; analyse it with `python game_trace.py FILE`.
+
+Game results are cached on disk (.eval_cache/), keyed by the bot's source,
+the training corpus and --seed: re-running with an unchanged bot only plays
+words that have no cached result yet. Use --no-cache to replay everything.
+
+Statistics are aggregated game by game, so memory does not grow with the
+number of games; --export FILE streams every result to CSV or Parquet.
+
+With --profile [BOT_FILE], a simulation runs under a sampling profiler that
+writes collapsed stacks for flamegraph tools and prints a top-N summary;
+--line-timing adds a per-section (Step 1-5) breakdown of predict_next_letter,
+including the helpers it calls from the bot file.
+
+With --memory-report [BOT_FILE], the bot is trained under tracemalloc and its
+resident memory is broken down by structure and word length instead of
+running games.
 """
 
 import sys
+import math
+import time
 import random
+import argparse
+from collections import defaultdict
+from statistics import NormalDist
 from pathlib import Path
 
 # Import the HangmanBot from user_template
 try:
-    from user_template import HangmanBot
+    from user_template import HangmanBot, load_bot_class
 except ImportError:
     print("Error: Could not import HangmanBot from user_template.py")
     print("Make sure user_template.py is in the same directory.")
@@ -40,7 +73,18 @@ def load_test_words():
         return ['python', 'machine', 'learning', 'algorithm', 'computer', 'hangman', 
                 'programming', 'artificial', 'intelligence', 'neural', 'network']
 
-def simulate_hangman_game(bot, word, max_lives=6):
+def load_training_words():
+    """Load the training corpus"""
+    try:
+        with open('training_words.txt', 'r') as f:
+            training_words = [line.strip() for line in f if line.strip()]
+        print(f"Loaded {len(training_words)} training words")
+    except FileNotFoundError:
+        print("training_words.txt not found. Using sample words.")
+        training_words = ['python', 'machine', 'learning', 'algorithm', 'computer'] * 1000
+    return training_words
+
+def simulate_hangman_game(bot, word, max_lives=6, trace_writer=None):
     """
     Simulate a single Hangman game
     
@@ -48,6 +92,7 @@ def simulate_hangman_game(bot, word, max_lives=6):
         bot: HangmanBot instance
         word: Word to guess
         max_lives: Maximum number of wrong guesses allowed
+        trace_writer: Optional game_trace.TraceWriter recording every guess
     
     Returns:
         dict: Game results
@@ -56,12 +101,18 @@ def simulate_hangman_game(bot, word, max_lives=6):
     wrong_guesses = set()
     lives = max_lives
     guesses = 0
+    guess_log = [] if trace_writer is not None else None
     
     while lives > 0 and '_' in masked_word:
         # Get bot's prediction
+        start = time.perf_counter()
         guess = bot.predict_next_letter(masked_word, wrong_guesses)
+        latency = time.perf_counter() - start
         guesses += 1
         
+        if guess_log is not None:
+            guess_log.append((guess, guess in word, latency))
+        
         # Check if guess is correct
         if guess in word:
             # Update masked word
@@ -80,6 +131,9 @@ def simulate_hangman_game(bot, word, max_lives=6):
     won = '_' not in masked_word
     lives_left = lives
     
+    if trace_writer is not None:
+        trace_writer.record_game(len(word), won, guess_log)
+    
     return {
         'word': word,
         'won': won,
@@ -88,14 +142,173 @@ def simulate_hangman_game(bot, word, max_lives=6):
         'final_masked': masked_word
     }
 
-def test_bot_performance(bot, test_words, num_tests=None):
+# =============================================================================
+# ONLINE STATISTICS AND STREAMING EXPORT
+# =============================================================================
+
+# Columns written by ResultStreamWriter
+RESULT_COLUMNS = ['word', 'length', 'won', 'guesses', 'lives_left', 'final_masked']
+
+class RunningTotals:
+    """O(1)-per-game totals for one group of games (all games, or one word length)"""
+    
+    __slots__ = ('games', 'wins', 'guesses', 'lives_left', 'min_guesses', 'max_guesses')
+    
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.guesses = 0
+        self.lives_left = 0
+        self.min_guesses = None
+        self.max_guesses = None
+    
+    def add(self, result):
+        """Fold one game result into the totals"""
+        self.games += 1
+        self.wins += bool(result['won'])
+        self.guesses += result['guesses']
+        self.lives_left += result['lives_left']
+        if self.min_guesses is None or result['guesses'] < self.min_guesses:
+            self.min_guesses = result['guesses']
+        if self.max_guesses is None or result['guesses'] > self.max_guesses:
+            self.max_guesses = result['guesses']
+    
+    @property
+    def win_rate(self):
+        return (self.wins / self.games) * 100 if self.games else 0.0
+    
+    @property
+    def avg_guesses(self):
+        return self.guesses / self.games if self.games else 0.0
+    
+    @property
+    def avg_lives_left(self):
+        return self.lives_left / self.games if self.games else 0.0
+
+class OnlineStats:
+    """
+    Aggregate statistics updated game by game
+    
+    Memory depends only on the number of distinct word lengths (plus a few
+    example results), never on the number of games.
+    """
+    
+    def __init__(self, num_examples=5):
+        self.total = RunningTotals()
+        self.by_length = defaultdict(RunningTotals)
+        self.guess_histogram = defaultdict(int)
+        self.num_examples = num_examples
+        self.examples = []
+    
+    def add(self, result):
+        """Fold one game result into every aggregate"""
+        self.total.add(result)
+        self.by_length[len(result['word'])].add(result)
+        self.guess_histogram[result['guesses']] += 1
+        if len(self.examples) < self.num_examples:
+            self.examples.append(result)
+    
+    def length_stats(self):
+        """Length -> {'total', 'wins', 'win_rate', 'avg_guesses', 'avg_lives_left'}"""
+        return {
+            length: {
+                'total': totals.games,
+                'wins': totals.wins,
+                'win_rate': totals.win_rate,
+                'avg_guesses': totals.avg_guesses,
+                'avg_lives_left': totals.avg_lives_left
+            }
+            for length, totals in sorted(self.by_length.items())
+        }
+
+class ResultStreamWriter:
+    """
+    Write game results to CSV or Parquet in chunks
+    
+    The format follows the file extension (.csv or .parquet). Rows are
+    buffered and written every chunk_size games, so memory stays flat.
+    Parquet needs pyarrow (pip install pyarrow); each chunk becomes a row group.
+    """
+    
+    def __init__(self, path, chunk_size=10000):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.rows = []
+        self.written = 0
+        self.parquet = str(path).lower().endswith('.parquet')
+        self._writer = None
+        self._file = None
+        
+        if self.parquet:
+            try:
+                import pyarrow.parquet
+            except ImportError:
+                raise RuntimeError("Parquet export needs pyarrow. Install with: pip install pyarrow")
+        else:
+            import csv
+            self._file = open(path, 'w', newline='')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(RESULT_COLUMNS)
+    
+    def write(self, result):
+        """Buffer one game result"""
+        self.rows.append((result['word'], len(result['word']), bool(result['won']),
+                          result['guesses'], result['lives_left'], result.get('final_masked', '')))
+        if len(self.rows) >= self.chunk_size:
+            self.flush()
+    
+    def flush(self):
+        """Write the buffered rows"""
+        if not self.rows:
+            return
+        if self.parquet:
+            import pandas as pd
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(pd.DataFrame(self.rows, columns=RESULT_COLUMNS), preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            self._writer.writerows(self.rows)
+            self._file.flush()
+        self.written += len(self.rows)
+        self.rows = []
+    
+    def close(self):
+        """Flush and close the file"""
+        self.flush()
+        if self.parquet and self._writer is not None:
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+# =============================================================================
+# PERFORMANCE TEST
+# =============================================================================
+
+def test_bot_performance(bot, test_words, num_tests=None, trace_writer=None, cache=None,
+                         result_writer=None, keep_results=True, make_bot=None):
     """
     Test bot performance on a set of words
     
     Args:
-        bot: HangmanBot instance
+        bot: HangmanBot instance (None to create it with make_bot)
         test_words: List of words to test
         num_tests: Number of tests to run (None for all words)
+        trace_writer: Optional game_trace.TraceWriter recording every guess
+        cache: Optional eval_cache.ResultCache; cached words are not replayed
+        result_writer: Optional ResultStreamWriter receiving every result
+        keep_results: Return every result dict under 'results'; set to False
+            for huge runs so memory does not grow with the number of games
+        make_bot: Callable creating the bot when bot is None; only called once
+            a word is not in the cache, so fully cached runs skip training
     
     Returns:
         dict: Performance statistics
@@ -103,39 +316,50 @@ def test_bot_performance(bot, test_words, num_tests=None):
     if num_tests:
         test_words = random.sample(test_words, min(num_tests, len(test_words)))
     
-    results = []
-    wins = 0
-    total_guesses = 0
+    online = OnlineStats()
+    results = [] if keep_results else None
     
     print(f"\nTesting bot on {len(test_words)} words...")
+    if cache is not None:
+        cached, missing = cache.lookup(test_words)
+        print(f"Cached results: {len(cached)} | Words to play: {len(missing)}")
     print("=" * 50)
     
     for i, word in enumerate(test_words, 1):
-        result = simulate_hangman_game(bot, word)
-        results.append(result)
+        result = cache.get(word) if cache is not None else None
+        if result is None:
+            if bot is None:
+                bot = make_bot()
+            result = simulate_hangman_game(bot, word, trace_writer=trace_writer)
+            if cache is not None:
+                cache.store(result)
         
-        if result['won']:
-            wins += 1
-        total_guesses += result['guesses']
+        online.add(result)
+        if results is not None:
+            results.append(result)
+        if result_writer is not None:
+            result_writer.write(result)
         
         # Show progress for every 50th word (less verbose)
         if i % 50 == 0 or i == len(test_words):
-            current_win_rate = (wins / i) * 100
-            print(f"Progress: {i}/{len(test_words)} | Win Rate: {current_win_rate:.1f}%")
-    
-    # Calculate final statistics
-    win_rate = (wins / len(test_words)) * 100
-    avg_guesses = total_guesses / len(test_words)
+            print(f"Progress: {i}/{len(test_words)} | Win Rate: {online.total.win_rate:.1f}%")
     
-    return {
-        'total_tests': len(test_words),
-        'wins': wins,
-        'losses': len(test_words) - wins,
-        'win_rate': win_rate,
-        'avg_guesses': avg_guesses,
-        'total_guesses': total_guesses,
-        'results': results
+    total = online.total
+    stats = {
+        'total_tests': total.games,
+        'wins': total.wins,
+        'losses': total.games - total.wins,
+        'win_rate': total.win_rate,
+        'avg_guesses': total.avg_guesses,
+        'total_guesses': total.guesses,
+        'avg_lives_left': total.avg_lives_left,
+        'length_stats': online.length_stats(),
+        'guess_histogram': dict(sorted(online.guess_histogram.items())),
+        'examples': online.examples
     }
+    if results is not None:
+        stats['results'] = results
+    return stats
 
 def print_detailed_results(stats):
     """Print detailed test results"""
@@ -149,48 +373,323 @@ def print_detailed_results(stats):
     print(f"Win Rate: {stats['win_rate']:.1f}%")
     print(f"Average Guesses: {stats['avg_guesses']:.1f}")
     print(f"Total Guesses: {stats['total_guesses']}")
+    print(f"Average Lives Left: {stats['avg_lives_left']:.1f}")
     
-    # Performance by word length
+    # Performance by word length (aggregated while the games were played)
     print("\nPerformance by Word Length:")
     print("-" * 30)
-    length_stats = {}
-    for result in stats['results']:
-        length = len(result['word'])
-        if length not in length_stats:
-            length_stats[length] = {'total': 0, 'wins': 0}
-        length_stats[length]['total'] += 1
-        if result['won']:
-            length_stats[length]['wins'] += 1
-    
-    for length in sorted(length_stats.keys()):
-        data = length_stats[length]
-        win_rate = (data['wins'] / data['total']) * 100
-        print(f"Length {length}: {data['wins']}/{data['total']} ({win_rate:.1f}%)")
+    for length, data in stats['length_stats'].items():
+        print(f"Length {length}: {data['wins']}/{data['total']} ({data['win_rate']:.1f}%)")
     
     # Show some example results
     print("\nExample Results:")
     print("-" * 20)
-    for result in stats['results'][:5]:  # Show first 5 results
+    for result in stats['examples']:  # Show first 5 results
         status = "WON" if result['won'] else "LOST"
         print(f"{result['word']}: {status} ({result['guesses']} guesses, {result['lives_left']} lives left)")
 
+# =============================================================================
+# PAIRED COMPARISON WITH SEQUENTIAL STOPPING
+# =============================================================================
+
+def stratified_word_stream(test_words, seed=None):
+    """
+    Yield test words without replacement, stratified by word length
+
+    Each length is drawn in proportion to its share of test_words, so any
+    prefix of the stream has (almost) the same length mix as the full set.
+    """
+    rng = random.Random(seed)
+    strata = defaultdict(list)
+    for word in test_words:
+        strata[len(word)].append(word)
+    for words in strata.values():
+        rng.shuffle(words)
+    
+    total = len(test_words)
+    drawn = defaultdict(int)
+    for n in range(1, total + 1):
+        # Draw from the length that is furthest behind its proportional quota
+        length = max(
+            (length for length in strata if drawn[length] < len(strata[length])),
+            key=lambda length: len(strata[length]) * n / total - drawn[length]
+        )
+        yield strata[length][drawn[length]]
+        drawn[length] += 1
+
+def stratified_estimate(strata, weights, total_key, square_key, fallback_var):
+    """
+    Stratified mean of a per-game quantity and the variance of that mean
+
+    Args:
+        strata: Length -> running sums for that length
+        weights: Length -> population share of that length
+        total_key: Key of the running sum of the quantity
+        square_key: Key of the running sum of its squares
+        fallback_var: Per-game variance assumed for strata with < 2 games
+
+    Returns:
+        tuple: (mean, variance of the mean)
+    """
+    sampled = [length for length in strata if strata[length]['n'] > 0]
+    weight_sum = sum(weights[length] for length in sampled)
+    
+    mean = 0.0
+    variance = 0.0
+    for length in sampled:
+        data = strata[length]
+        n = data['n']
+        w = weights[length] / weight_sum
+        stratum_mean = data[total_key] / n
+        if n > 1:
+            stratum_var = max(0.0, (data[square_key] - n * stratum_mean ** 2) / (n - 1))
+        else:
+            stratum_var = fallback_var
+        mean += w * stratum_mean
+        variance += w ** 2 * stratum_var / n
+    return mean, variance
+
+def compare_bots(bots, test_words, confidence=0.95, max_games=2000, batch_size=50,
+                 min_games=50, seed=None):
+    """
+    Compare two bots on the same words, stopping as soon as the result is decided
+
+    Words are drawn stratified by length and each word is played by both
+    bots. After every batch the stratified confidence interval for the
+    difference in win rate is checked; the comparison stops once it excludes
+    zero or the game budget runs out. The z-value is Bonferroni-corrected for
+    the number of looks, so repeatedly checking does not inflate the error rate.
+
+    Args:
+        bots: Dict of exactly two names -> HangmanBot instances
+        test_words: Pool of words to draw from
+        confidence: Required confidence level (e.g. 0.95)
+        max_games: Game budget per bot
+        batch_size: Games per bot between checks
+        min_games: Games per bot before the first check
+        seed: Random seed for the word order
+
+    Returns:
+        dict: Comparison statistics
+    """
+    (name_a, bot_a), (name_b, bot_b) = bots.items()
+    
+    max_games = min(max_games, len(test_words))
+    looks = max(1, math.ceil(max(0, max_games - min_games) / batch_size) + 1)
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / (2 * looks))
+    
+    length_counts = defaultdict(int)
+    for word in test_words:
+        length_counts[len(word)] += 1
+    weights = {length: count / len(test_words) for length, count in length_counts.items()}
+    
+    strata = defaultdict(lambda: {'n': 0, 'a': 0, 'b': 0, 'd': 0, 'd2': 0})
+    games = 0
+    decided = False
+    
+    print(f"\nComparing {name_a} vs {name_b} (confidence {confidence:.0%}, budget {max_games} words)")
+    print("=" * 60)
+    
+    for word in stratified_word_stream(test_words, seed):
+        won_a = simulate_hangman_game(bot_a, word)['won']
+        won_b = simulate_hangman_game(bot_b, word)['won']
+        diff = int(won_a) - int(won_b)
+        
+        data = strata[len(word)]
+        data['n'] += 1
+        data['a'] += won_a
+        data['b'] += won_b
+        data['d'] += diff
+        data['d2'] += diff * diff
+        games += 1
+        
+        if games >= max_games:
+            break
+        if games >= min_games and (games - min_games) % batch_size == 0:
+            diff_mean, diff_var = stratified_estimate(strata, weights, 'd', 'd2', 1.0)
+            half_width = z * math.sqrt(diff_var)
+            print(f"Games: {games} | Difference: {diff_mean * 100:+.1f}% ± {half_width * 100:.1f}%")
+            if abs(diff_mean) > half_width:
+                decided = True
+                break
+    
+    # Binary outcomes: the sum of squares equals the sum
+    rate_a, var_a = stratified_estimate(strata, weights, 'a', 'a', 0.25)
+    rate_b, var_b = stratified_estimate(strata, weights, 'b', 'b', 0.25)
+    diff_mean, diff_var = stratified_estimate(strata, weights, 'd', 'd2', 1.0)
+    
+    def interval(mean, var, low=0.0, high=1.0):
+        half_width = z * math.sqrt(var)
+        return max(low, mean - half_width) * 100, min(high, mean + half_width) * 100
+    
+    return {
+        'names': (name_a, name_b),
+        'games': games,
+        'max_games': max_games,
+        'confidence': confidence,
+        'decided': decided or abs(diff_mean) > z * math.sqrt(diff_var),
+        'win_rates': (rate_a * 100, rate_b * 100),
+        'win_rate_intervals': (interval(rate_a, var_a), interval(rate_b, var_b)),
+        'difference': diff_mean * 100,
+        'difference_interval': interval(diff_mean, diff_var, -1.0, 1.0)
+    }
+
+def print_comparison_results(comparison):
+    """Print the outcome of a paired bot comparison"""
+    name_a, name_b = comparison['names']
+    
+    print("\n" + "=" * 60)
+    print("PAIRED COMPARISON RESULTS")
+    print("=" * 60)
+    print(f"Games per bot: {comparison['games']} (budget {comparison['max_games']})")
+    print(f"Confidence: {comparison['confidence']:.0%}")
+    print()
+    for name, rate, (low, high) in zip(comparison['names'], comparison['win_rates'],
+                                       comparison['win_rate_intervals']):
+        print(f"{name}: {rate:.1f}% win rate [{low:.1f}%, {high:.1f}%]")
+    
+    low, high = comparison['difference_interval']
+    print(f"\nDifference ({name_a} - {name_b}): {comparison['difference']:+.1f}% [{low:+.1f}%, {high:+.1f}%]")
+    
+    if comparison['decided']:
+        better = name_a if comparison['difference'] > 0 else name_b
+        print(f"\nDecided: {better} is better")
+    else:
+        print("\nUndecided: no significant difference within the game budget")
+
+def run_comparison(args):
+    """Train both bots and run a paired comparison"""
+    training_words = load_training_words()
+    
+    # Labelled by position, so a bot can be compared with itself (an A/A test)
+    bots = {}
+    for label, path in zip("AB", args.compare):
+        print(f"Initializing HangmanBot {label} from {path}...")
+        bots[f"{label}: {path}"] = load_bot_class(path)(training_words)
+    
+    if args.words:
+        with open(args.words, 'r') as f:
+            test_words = [line.strip().lower() for line in f if line.strip()]
+    else:
+        test_words = load_test_words()
+    
+    comparison = compare_bots(bots, test_words, args.confidence, args.max_games,
+                              args.batch_size, seed=args.seed)
+    print_comparison_results(comparison)
+
+def run_memory_report(args):
+    """Train a bot under tracemalloc and print where its memory goes"""
+    from bot_memory import measure_training, print_memory_report, structure_report
+    
+    training_words = load_training_words()
+    bot_class = load_bot_class(args.memory_report)
+    
+    # Only bots that support a parallel index build take build_workers
+    kwargs = {'build_workers': args.build_workers} if args.build_workers else {}
+    
+    print(f"Initializing HangmanBot from {args.memory_report}...")
+    bot, training = measure_training(bot_class, training_words, **kwargs)
+    
+    report = bot.memory_report() if hasattr(bot, 'memory_report') else structure_report(bot)
+    print_memory_report(report, training)
+    
+    build_stats = getattr(bot, 'build_stats', None)
+    if build_stats:
+        print("\nIndex Build:")
+        print("-" * 30)
+        print(f"Build time: {build_stats['seconds']:.2f} seconds with {build_stats['workers']} process(es)")
+        if build_stats.get('peak_rss_mb') is not None:
+            print(f"Peak RSS: {build_stats['peak_rss_mb']:.1f} MB")
+        if build_stats.get('worker_peak_rss_mb') is not None:
+            print(f"Peak worker RSS: {build_stats['worker_peak_rss_mb']:.1f} MB")
+
+def run_profile(args):
+    """Play a simulation under the profiler and report where the time goes"""
+    from bot_profiler import StackSampler, SectionTimer, print_top_functions
+    
+    training_words = load_training_words()
+    print(f"Initializing HangmanBot from {args.profile}...")
+    bot = load_bot_class(args.profile)(training_words)
+    
+    if args.words:
+        with open(args.words, 'r') as f:
+            test_words = [line.strip().lower() for line in f if line.strip()]
+    else:
+        test_words = load_test_words()
+    rng = random.Random(args.seed)
+    words = [rng.choice(test_words) for _ in range(args.profile_games)]
+    
+    print(f"\nProfiling {len(words)} games...")
+    start = time.perf_counter()
+    with StackSampler(args.profile_interval / 1000) as sampler:
+        wins = sum(simulate_hangman_game(bot, word)['won'] for word in words)
+    elapsed = time.perf_counter() - start
+    print(f"Played {len(words)} games in {elapsed:.2f} seconds ({wins} won)")
+    
+    sampler.write_collapsed(args.profile_output)
+    print_top_functions(sampler, args.profile_top)
+    print(f"\nCollapsed stacks written to {args.profile_output} (e.g. flamegraph.pl {args.profile_output} > profile.svg)")
+    
+    if args.line_timing:
+        # A second, traced pass over the same words
+        with SectionTimer(bot.predict_next_letter) as timer:
+            for word in words:
+                simulate_hangman_game(bot, word)
+        timer.print_report()
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Test your HangmanBot's success rate")
+    parser.add_argument('--compare', nargs=2, metavar=('BOT_A', 'BOT_B'),
+                        help="Compare two bot files on the same words with early stopping")
+    parser.add_argument('--words', help="Word file to draw comparison words from")
+    parser.add_argument('--confidence', type=float, default=0.95, help="Confidence level for --compare")
+    parser.add_argument('--max-games', type=int, default=2000, help="Game budget per bot for --compare")
+    parser.add_argument('--batch-size', type=int, default=50, help="Games between checks for --compare")
+    parser.add_argument('--seed', type=int, help="Random seed")
+    parser.add_argument('--trace', metavar='FILE', help="Append a binary trace of every guess to FILE")
+    parser.add_argument('--num-tests', type=int, default=100, help="Number of test words to play")
+    parser.add_argument('--export', metavar='FILE',
+                        help="Stream every game result to FILE (.csv or .parquet)")
+    parser.add_argument('--no-cache', action='store_true', help="Replay every game instead of using cached results")
+    parser.add_argument('--cache-dir', default='.eval_cache', help="Directory of cached game results")
+    parser.add_argument('--cache-size-mb', type=float, default=64, help="Size limit of the result cache")
+    parser.add_argument('--profile', nargs='?', const='user_template.py', metavar='BOT_FILE',
+                        help="Profile a simulation of a bot (default: user_template.py) and exit")
+    parser.add_argument('--profile-games', type=int, default=200, help="Games to play under the profiler")
+    parser.add_argument('--profile-output', default='profile.folded', help="Collapsed-stack output file")
+    parser.add_argument('--profile-top', type=int, default=20, help="Functions in the top-N summary")
+    parser.add_argument('--profile-interval', type=float, default=1.0, help="Sampling interval in milliseconds")
+    parser.add_argument('--line-timing', action='store_true',
+                        help="With --profile, also time predict_next_letter line by line per Step section")
+    parser.add_argument('--build-workers', type=int,
+                        help="Processes building the bot's index (bots that support it, e.g. python)")
+    parser.add_argument('--memory-report', nargs='?', const='user_template.py', metavar='BOT_FILE',
+                        help="Report the memory held by a bot (default: user_template.py) and exit")
+    return parser.parse_args()
+
 def main():
     """Main testing function"""
     print("Hangman Bot Success Rate Tester")
     print("=" * 40)
     
+    args = parse_args()
+    if args.compare:
+        run_comparison(args)
+        return
+    if args.memory_report:
+        run_memory_report(args)
+        return
+    if args.profile:
+        run_profile(args)
+        return
+    
     # Load training data
-    try:
-        with open('training_words.txt', 'r') as f:
-            training_words = [line.strip() for line in f if line.strip()]
-        print(f"Loaded {len(training_words)} training words")
-    except FileNotFoundError:
-        print("training_words.txt not found. Using sample words.")
-        training_words = ['python', 'machine', 'learning', 'algorithm', 'computer'] * 1000
+    training_words = load_training_words()
     
-    # Create bot
-    print("Initializing HangmanBot...")
-    bot = HangmanBot(training_words)
+    def make_bot():
+        print("Initializing HangmanBot...")
+        return HangmanBot(training_words)
     
     # Load test words
     test_words = load_test_words()
@@ -200,11 +699,36 @@ def main():
     print(f"Available test words: {len(test_words)}")
     
     # Use reasonable default for production
-    num_tests = min(100, len(test_words))  # Test up to 100 words by default
+    num_tests = min(args.num_tests, len(test_words))  # Test up to 100 words by default
     print(f"Testing {num_tests} words (production default)")
+    if args.seed is not None:
+        random.seed(args.seed)
+    
+    # Only aggregates are kept; per-game rows go to --export if requested
+    result_writer = ResultStreamWriter(args.export) if args.export else None
+    run = dict(result_writer=result_writer, keep_results=False)
     
     # Run tests
-    stats = test_bot_performance(bot, test_words, num_tests)
+    try:
+        if args.trace:
+            # Traces need every guess, so nothing is taken from the cache
+            from game_trace import TraceWriter
+            with TraceWriter(args.trace) as trace_writer:
+                stats = test_bot_performance(make_bot(), test_words, num_tests, trace_writer, **run)
+            print(f"Game trace written to {args.trace}")
+        elif args.no_cache:
+            stats = test_bot_performance(make_bot(), test_words, num_tests, **run)
+        else:
+            from eval_cache import ResultCache
+            cache = ResultCache.for_bot(sys.modules[HangmanBot.__module__].__file__, training_words, args.seed,
+                                        cache_dir=args.cache_dir, max_bytes=int(args.cache_size_mb * 1024 * 1024))
+            # The bot is only trained once a word turns out not to be cached
+            stats = test_bot_performance(None, test_words, num_tests, cache=cache, make_bot=make_bot, **run)
+            cache.save()
+    finally:
+        if result_writer is not None:
+            result_writer.close()
+            print(f"{result_writer.written} results exported to {args.export}")
     
     # Print results
     print_detailed_results(stats)
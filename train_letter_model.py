@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Self-Play Training Pipeline for a scikit-learn Letter Model
+
+Generates (game state -> correct next letter) samples by simulating games over
+training_words.txt, streams them as sparse feature batches and trains a
+classifier incrementally with partial_fit. The full dataset is never held in
+memory: each batch is generated, fed to the model and dropped.
+
+Usage:
+    python train_letter_model.py
+    python train_letter_model.py --epochs 3 --batch-words 2000 --n-jobs 4 --output letter_model.joblib
+
+How samples are made:
+- Each word is played by a noisy frequency policy (mostly the most common
+  unguessed letter, sometimes a random one) so that both hits and misses occur.
+- Before every guess the current state is recorded, labelled with one of the
+  letters still hidden in the word (chosen at random). A model trained this way
+  learns, for each letter, how likely it is to be hidden in the word.
+"""
+
+import sys
+import time
+import random
+import argparse
+from collections import Counter
+
+import numpy as np
+from joblib import Parallel, delayed, dump
+from sklearn.linear_model import SGDClassifier
+
+from letter_model import ALPHABET, StateEncoder
+
+LETTER_INDEX = {letter: i for i, letter in enumerate(ALPHABET)}
+
+def self_play_samples(words, letter_order, rng, explore=0.2, max_lives=6):
+    """
+    Play each word once and yield (masked_word, wrong_guesses, target letter)
+
+    Args:
+        words: Words to play
+        letter_order: Letters from most to least common (the greedy policy)
+        rng: random.Random instance
+        explore: Probability of guessing a random unguessed letter instead
+        max_lives: Wrong guesses allowed per game
+    """
+    for word in words:
+        if not word.isalpha() or not word.isascii():
+            continue
+
+        masked = ['_'] * len(word)
+        guessed = set()
+        wrong = set()
+
+        while len(wrong) < max_lives and '_' in masked:
+            hidden = sorted({c for c, m in zip(word, masked) if m == '_'})
+            yield ''.join(masked), frozenset(wrong), rng.choice(hidden)
+
+            remaining = [letter for letter in letter_order if letter not in guessed]
+            guess = rng.choice(remaining) if rng.random() < explore else remaining[0]
+            guessed.add(guess)
+
+            if guess in word:
+                masked = [c if c == guess else m for c, m in zip(word, masked)]
+            else:
+                wrong.add(guess)
+
+def build_batch(words, letter_order, seed, explore):
+    """
+    Generate the samples for a chunk of words as one sparse batch
+
+    Runs in a joblib worker.
+
+    Returns:
+        tuple: (CSR feature matrix, label array)
+    """
+    rng = random.Random(seed)
+    states = []
+    labels = []
+
+    for masked_word, wrong, target in self_play_samples(words, letter_order, rng, explore):
+        states.append((masked_word, wrong))
+        labels.append(LETTER_INDEX[target])
+
+    return StateEncoder().encode_batch(states), np.array(labels, dtype=np.int8)
+
+def stream_batches(words, batch_words=500, epochs=1, n_jobs=-1, seed=0, explore=0.2):
+    """
+    Stream sparse training batches, generated in parallel
+
+    Words are split into chunks of batch_words; each chunk becomes one batch.
+    Only a few chunks are in flight at once, so memory stays flat however many
+    samples are produced.
+
+    Yields:
+        tuple: (CSR feature matrix, label array)
+    """
+    letter_order = [letter for letter, _ in Counter(''.join(words)).most_common() if letter in LETTER_INDEX]
+    letter_order += [letter for letter in ALPHABET if letter not in letter_order]
+
+    def tasks():
+        for epoch in range(epochs):
+            order = list(words)
+            random.Random(seed + epoch).shuffle(order)
+            for start in range(0, len(order), batch_words):
+                chunk_seed = seed * 1_000_003 + epoch * 10_007 + start
+                yield delayed(build_batch)(order[start:start + batch_words], letter_order, chunk_seed, explore)
+
+    parallel = Parallel(n_jobs=n_jobs, return_as='generator', pre_dispatch='2*n_jobs')
+    yield from parallel(tasks())
+
+def train(words, epochs=1, batch_words=500, n_jobs=-1, seed=0, explore=0.2, max_samples=None):
+    """
+    Train an SGD logistic-regression letter model with partial_fit
+
+    Args:
+        words: Training words
+        epochs: Passes of self-play over the words
+        batch_words: Words per generated batch
+        n_jobs: joblib workers generating batches (-1 = all cores)
+        seed: Random seed
+        explore: Probability of a random guess during self-play
+        max_samples: Stop after this many samples (None = no limit)
+
+    Returns:
+        SGDClassifier: Trained model; predict_proba columns are a-z
+    """
+    model = SGDClassifier(loss='log_loss', alpha=1e-5, random_state=seed)
+    classes = np.arange(26)
+    samples = 0
+    start = time.time()
+
+    for batch, (X, y) in enumerate(stream_batches(words, batch_words, epochs, n_jobs, seed, explore), 1):
+        if not len(y):
+            continue
+        model.partial_fit(X, y, classes=classes)
+        samples += len(y)
+
+        if batch % 20 == 0:
+            rate = samples / (time.time() - start)
+            print(f"Batches: {batch} | Samples: {samples} | {rate:.0f} samples/s")
+        if max_samples and samples >= max_samples:
+            break
+
+    print(f"Trained on {samples} samples in {time.time() - start:.1f} seconds")
+    return model
+
+def main():
+    """Train a letter model from self-play and save it"""
+    parser = argparse.ArgumentParser(description="Self-play training for a scikit-learn letter model")
+    parser.add_argument('--words', default='training_words.txt', help="Training word file")
+    parser.add_argument('--epochs', type=int, default=1, help="Self-play passes over the words")
+    parser.add_argument('--batch-words', type=int, default=500, help="Words per generated batch")
+    parser.add_argument('--n-jobs', type=int, default=-1, help="Parallel generator workers")
+    parser.add_argument('--explore', type=float, default=0.2, help="Random-guess probability in self-play")
+    parser.add_argument('--max-samples', type=int, help="Stop after this many samples")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='letter_model.joblib', help="Where to save the model")
+    args = parser.parse_args()
+
+    print("Hangman Letter Model - Self-Play Training")
+    print("=" * 45)
+
+    with open(args.words, 'r') as f:
+        words = [line.strip().lower() for line in f if line.strip()]
+    print(f"Loaded {len(words)} training words")
+
+    model = train(words, args.epochs, args.batch_words, args.n_jobs, args.seed,
+                  args.explore, args.max_samples)
+    dump(model, args.output)
+    print(f"Model saved to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
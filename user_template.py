@@ -12,26 +12,39 @@ This template provides:
 Users need to implement the HangmanBot class and choose a web framework.
 """
 
+import os
+import hmac
+import time
 import random
+import threading
 from collections import Counter
-from typing import List, Set
-import pickle
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# Bot files and artifacts (re-exported here for existing imports)
+from bot_loader import load_bot_class, save_bot_artifact, load_bot_artifact
 
 # Flask imports
-from flask import Flask, render_template_string, request, jsonify, session
+from flask import Flask, Response, render_template_string, request, jsonify, session, stream_with_context
 import json
 
 # Dash imports (alternative to Flask)
 try:
     import dash
-    from dash import dcc, html, Input, Output, State, callback
+    from dash import dcc, html, Input, Output, State, Patch, callback
     import plotly.graph_objs as go
-    import plotly.express as px
     DASH_AVAILABLE = True
 except ImportError:
     DASH_AVAILABLE = False
     print("Dash not available. Install with: pip install dash plotly")
 
+# Background callback support for Dash (runs long simulations off the server thread)
+try:
+    import diskcache
+    BACKGROUND_CALLBACKS_AVAILABLE = DASH_AVAILABLE
+except ImportError:
+    BACKGROUND_CALLBACKS_AVAILABLE = False
+
 class HangmanBot:
     """
     Your Hangman Bot Implementation
@@ -39,10 +52,17 @@ class HangmanBot:
     This is the core ML component users need to implement!
     """
     
+    # Bump when the attributes set in __init__ change, so saved artifacts of
+    # the old version are rebuilt instead of loaded (see save_bot_artifact)
+    STATE_VERSION = 1
+    
     def __init__(self, training_words: List[str]):
         """Initialize your bot with training words"""
         self.training_words = [word.lower() for word in training_words]
         
+        # Vocabulary updates (add_words/remove_words) take turns
+        self._write_lock = threading.Lock()
+        
         # TODO: Add your training logic here
         # Examples:
         # - Build letter frequency models
@@ -90,15 +110,280 @@ class HangmanBot:
         
         return list(available_letters)[0]  # Fallback
 
+    def add_words(self, words) -> int:
+        """
+        Add training words without retraining from scratch
+        
+        Args:
+            words: Iterable of new words
+            
+        Returns:
+            Number of words added
+        """
+        new_words = [word.lower() for word in words]
+        
+        # The word list is only appended to, in place (copying it would cost as much
+        # as the whole corpus); the small letter table predictions read is updated
+        # as a copy and swapped in, so they never see a partial update
+        with self._write_lock:
+            letter_freq = self.letter_freq.copy()
+            for word in new_words:
+                letter_freq.update(word)
+            self.training_words.extend(new_words)
+            self.letter_freq = letter_freq
+        return len(new_words)
+    
+    def remove_words(self, words) -> int:
+        """
+        Remove training words (every copy of each) without retraining from scratch
+        
+        Args:
+            words: Iterable of words to remove
+            
+        Returns:
+            Number of words removed
+        """
+        gone = {word.lower() for word in words}
+        with self._write_lock:
+            kept = []
+            letter_freq = self.letter_freq.copy()
+            for word in self.training_words:
+                if word in gone:
+                    letter_freq.subtract(word)
+                else:
+                    kept.append(word)
+            
+            removed = len(self.training_words) - len(kept)
+            self.training_words = kept
+            self.letter_freq = +letter_freq  # drop letters whose count fell to 0
+        return removed
+    
+    def __getstate__(self):
+        """Pickle everything but the lock (it cannot be pickled)"""
+        state = self.__dict__.copy()
+        state.pop('_write_lock', None)
+        return state
+    
+    def __setstate__(self, state):
+        """Restore a pickled bot with a new lock"""
+        self.__dict__.update(state)
+        self._write_lock = threading.Lock()
+    
+    def memory_report(self) -> dict:
+        """
+        Resident memory of this bot, by structure and by word length
+
+        Returns:
+            dict: total_bytes, structures, by_length, words, bytes_per_word
+                  (see bot_memory.structure_report)
+        """
+        from bot_memory import structure_report
+        return structure_report(self)
+
+def simulate_game(bot, word: str, max_lives: int = 6) -> dict:
+    """
+    Play one full Hangman game with the bot
+
+    Args:
+        bot: HangmanBot instance
+        word: Word to guess
+        max_lives: Maximum number of wrong guesses allowed
+
+    Returns:
+        dict: Game result (word, won, guesses, lives_left)
+    """
+    masked_word = '_' * len(word)
+    wrong_guesses = set()
+    lives = max_lives
+    guesses = 0
+
+    while lives > 0 and '_' in masked_word:
+        guess = bot.predict_next_letter(masked_word, wrong_guesses)
+        guesses += 1
+
+        if guess in word:
+            masked_word = ''.join(
+                char if char == guess else masked_word[i]
+                for i, char in enumerate(word)
+            )
+        else:
+            wrong_guesses.add(guess)
+            lives -= 1
+
+    return {
+        'word': word,
+        'won': '_' not in masked_word,
+        'guesses': guesses,
+        'lives_left': lives
+    }
+
+# Letters from most to least common in English text
+ENGLISH_LETTER_ORDER = 'etaoinshrdlcumwfgypbvkjxqz'
+
+class FrequencyBot:
+    """
+    Corpus-free bot that guesses letters in English frequency order
+
+    Needs no training, so the web server can answer with it while the real
+    model is still warming up.
+    """
+    
+    def predict_next_letter(self, masked_word: str, wrong_guesses: Set[str]) -> str:
+        """Return the most common English letter not guessed yet"""
+        guessed = set(masked_word.replace('_', '')) | set(wrong_guesses)
+        for letter in ENGLISH_LETTER_ORDER:
+            if letter not in guessed:
+                return letter
+        return 'a'  # Fallback
+
+# =============================================================================
+# BOT REGISTRY (several named bot variants, hot-swappable)
+# =============================================================================
+
+# Bot variants that ship with the repository: name -> file defining HangmanBot
+BOT_FILES = {
+    'template': 'user_template.py',
+    'python': 'python',
+    'python_moyo': 'python moyo',
+}
+
+class BotRegistry:
+    """
+    Named bot variants that can be replaced while the server is running
+
+    Lookups never block: the name -> bot mapping is replaced as a whole
+    (copy-on-write) whenever a bot is added or swapped, so a request always
+    sees either the old or the new bot, never a half-loaded one.
+    
+    A registry created without bots is "warming up" until warm_up() finishes;
+    until then lookups of bots that are not registered yet return the
+    fallback bot (if one is set) instead of failing.
+    """
+    
+    def __init__(self, bots: Optional[Dict[str, object]] = None, default: Optional[str] = None,
+                 fallback=None):
+        self._bots = dict(bots or {})
+        self._write_lock = threading.Lock()
+        self.default = default or next(iter(self._bots), None)
+        self.fallback = fallback
+        self.loading = {}  # name -> 'loading', 'ready' or an error message
+        self.ready = threading.Event()
+        if self._bots:
+            self.ready.set()
+    
+    def names(self) -> List[str]:
+        """Names of the registered bots"""
+        return sorted(self._bots)
+    
+    def get(self, name: Optional[str] = None):
+        """Return the bot registered under name (the default bot if None)"""
+        name = name or self.default
+        bot = self._bots.get(name)
+        if bot is None and self.fallback is not None and not self.ready.is_set():
+            return self.fallback
+        if bot is None:
+            raise LookupError(f"Unknown bot '{name}' (available: {', '.join(self.names())})")
+        return bot
+    
+    def register(self, name: str, bot):
+        """Add a bot, or atomically swap in a new one under an existing name"""
+        with self._write_lock:
+            bots = dict(self._bots)
+            bots[name] = bot
+            self._bots = bots
+            if self.default is None:
+                self.default = name
+    
+    def load(self, name: str, artifact_path: str):
+        """Load an artifact and register it under name"""
+        self.register(name, load_bot_artifact(artifact_path))
+    
+    def load_in_background(self, name: str, artifact_path: str) -> threading.Thread:
+        """Load an artifact on a background thread, swapping it in when ready"""
+        def worker():
+            try:
+                self.load(name, artifact_path)
+                self.loading[name] = 'ready'
+                print(f"Bot '{name}' loaded from {artifact_path}")
+            except Exception as e:
+                self.loading[name] = f"error: {e}"
+                print(f"Failed to load bot '{name}' from {artifact_path}: {e}")
+        
+        self.loading[name] = 'loading'
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
+    
+    def warm_up(self, build) -> threading.Thread:
+        """
+        Populate the registry on a background thread
+        
+        Args:
+            build: Callable taking this registry and registering the bots
+        
+        Returns:
+            threading.Thread: The warm-up thread; self.ready is set when it ends
+        """
+        def worker():
+            start = time.time()
+            try:
+                build(self)
+                self.loading['warm_up'] = 'ready'
+                print(f"Warm-up completed in {time.time() - start:.1f} seconds")
+            except Exception as e:
+                self.loading['warm_up'] = f"error: {e}"
+                print(f"Warm-up failed: {e}")
+            finally:
+                self.ready.set()
+        
+        self.loading['warm_up'] = 'loading'
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
+
+def build_bot_artifacts(training_words: List[str], artifact_dir: str = 'artifacts'):
+    """Train every bot variant in BOT_FILES and save it to artifact_dir"""
+    Path(artifact_dir).mkdir(exist_ok=True)
+    for name, bot_file in BOT_FILES.items():
+        print(f"Training bot '{name}' from {bot_file}...")
+        bot = load_bot_class(bot_file)(training_words)
+        if hasattr(bot, 'solve_short_lengths'):
+            # Precompute answers for short words so they ship with the artifact
+            for length, (states, wins) in bot.solve_short_lengths().items():
+                print(f"  Length {length}: {states} policy states, {wins} words won")
+        save_bot_artifact(bot, bot_file, str(Path(artifact_dir) / f"{name}.pkl"))
+    print(f"Saved {len(BOT_FILES)} bot artifacts to {artifact_dir}/")
+
 # =============================================================================
 # FLASK WEB INTERFACE
 # =============================================================================
 
-def create_flask_app(bot):
-    """Create Flask web interface"""
+# Environment variable holding the token that lets remote clients use the bot
+# admin routes (/api/bots/<name>/words and /load); without it they only
+# answer requests from this machine
+ADMIN_TOKEN_ENV = 'HANGMAN_ADMIN_TOKEN'
+
+# Largest request body the web interface accepts (bigger ones get 413)
+MAX_REQUEST_BYTES = 1024 * 1024
+
+def create_flask_app(bot, artifact_dir: str = 'artifacts', admin_token: Optional[str] = None):
+    """
+    Create Flask web interface
+
+    Args:
+        bot: A HangmanBot, or a BotRegistry of named bots. API calls pick a
+            registered bot with the ?bot=<name> query parameter.
+        artifact_dir: Directory /api/bots/<name>/load may load artifacts from
+        admin_token: Token remote clients must send in the X-Admin-Token
+            header to use the bot admin routes (default: $HANGMAN_ADMIN_TOKEN)
+    """
+    
+    registry = bot if isinstance(bot, BotRegistry) else BotRegistry({'default': bot})
+    admin_token = admin_token or os.environ.get(ADMIN_TOKEN_ENV)
     
     app = Flask(__name__)
     app.secret_key = 'hangman_secret_key'
+    app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BYTES
     
     # HTML template embedded in Python (no separate HTML files needed!)
     HTML_TEMPLATE = """
@@ -135,7 +420,9 @@ def create_flask_app(bot):
                 <button onclick="getBotGuess()">Get Bot Guess</button>
                 <button onclick="newGame()">New Game</button>
                 <button onclick="runSimulation()">Run Simulation</button>
+                <button onclick="autoplay()">Autoplay</button>
             </div>
+            <div id="autoplay-status"></div>
         </div>
         
         <div class="stats">
@@ -167,7 +454,8 @@ def create_flask_app(bot):
                     .then(data => {
                         if (data.success) {
                             updateGameState(data.game_state);
-                            alert('Bot guesses: ' + data.guess);
+                            alert('Bot guesses: ' + data.guess +
+                                  (data.warming_up ? ' (model warming up, frequency guess)' : ''));
                         } else {
                             alert('Error: ' + data.error);
                         }
@@ -198,6 +486,29 @@ def create_flask_app(bot):
                     });
             }
             
+            function autoplay() {
+                // The server plays the whole game and streams every guess (Server-Sent Events)
+                const source = new EventSource('/api/autoplay');
+                const status = document.getElementById('autoplay-status');
+                
+                source.onmessage = event => {
+                    const data = JSON.parse(event.data);
+                    updateGameState(data.game_state);
+                    status.textContent = 'Bot guesses: ' + data.guess + (data.correct ? ' (hit)' : ' (miss)');
+                };
+                source.addEventListener('done', event => {
+                    const data = JSON.parse(event.data);
+                    updateGameState(data.game_state);
+                    status.textContent = data.won ? 'Bot won! The word was ' + data.word
+                                                  : 'Bot lost. The word was ' + data.word;
+                    source.close();
+                });
+                source.onerror = () => {
+                    status.textContent = 'Autoplay connection lost';
+                    source.close();
+                };
+            }
+            
             function updateGameState(gameState) {
                 document.getElementById('word-display').textContent = gameState.masked_word;
                 document.getElementById('lives').textContent = gameState.lives;
@@ -224,6 +535,17 @@ def create_flask_app(bot):
     </html>
     """
     
+    def game_bot_name():
+        """
+        Bot name to remember for a new game
+        
+        During warm-up the default may still change, so unless a bot was asked
+        for, None is stored and the default is looked up at every guess.
+        """
+        if request.args.get('bot'):
+            return request.args.get('bot')
+        return registry.default if registry.ready.is_set() else None
+    
     @app.route('/')
     def index():
         """Main game page"""
@@ -250,12 +572,17 @@ def create_flask_app(bot):
             words = ['python', 'machine', 'learning', 'algorithm', 'computer', 'hangman']
             word = random.choice(words)
             
+            # Remember which bot variant plays this game
+            bot_name = game_bot_name()
+            registry.get(bot_name)
+            
             session['game_state'] = {
                 'word': word,
                 'masked_word': '_' * len(word),
                 'lives': 6,
                 'wrong_guesses': [],
-                'game_over': False
+                'game_over': False,
+                'bot': bot_name
             }
             
             return jsonify({
@@ -274,6 +601,7 @@ def create_flask_app(bot):
                 return jsonify({'success': False, 'error': 'No active game'})
             
             # Get bot's prediction
+            bot = registry.get(request.args.get('bot') or game_state.get('bot'))
             guess = bot.predict_next_letter(
                 game_state['masked_word'], 
                 set(game_state['wrong_guesses'])
@@ -305,15 +633,70 @@ def create_flask_app(bot):
             return jsonify({
                 'success': True,
                 'guess': guess,
-                'game_state': game_state
+                'game_state': game_state,
+                # True while the model is loading and a frequency-only bot answers
+                'warming_up': bot is registry.fallback
             })
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)})
     
+    @app.route('/api/autoplay')
+    def autoplay():
+        """Play the current (or a new) game to the end, streaming each guess as an SSE event"""
+        game_state = session.get('game_state', {})
+        if not game_state.get('word') or game_state.get('game_over', False):
+            word = random.choice(['python', 'machine', 'learning', 'algorithm', 'computer', 'hangman'])
+            game_state = {
+                'word': word,
+                'masked_word': '_' * len(word),
+                'lives': 6,
+                'wrong_guesses': [],
+                'game_over': False,
+                'bot': game_bot_name()
+            }
+        
+        try:
+            bot = registry.get(request.args.get('bot') or game_state.get('bot'))
+        except LookupError as e:
+            return jsonify({'success': False, 'error': str(e)})
+        
+        # The cookie is sent before the stream starts, so record the game as
+        # finished now; the client receives the final state from the stream
+        session['game_state'] = dict(game_state, game_over=True)
+        
+        def play():
+            state = dict(game_state, wrong_guesses=list(game_state['wrong_guesses']))
+            word = state['word']
+            
+            while not state['game_over']:
+                guess = bot.predict_next_letter(state['masked_word'], set(state['wrong_guesses']))
+                correct = guess in word
+                
+                if correct:
+                    state['masked_word'] = ''.join(
+                        char if char == guess else state['masked_word'][i]
+                        for i, char in enumerate(word)
+                    )
+                else:
+                    state['wrong_guesses'].append(guess)
+                    state['lives'] -= 1
+                
+                if '_' not in state['masked_word'] or state['lives'] <= 0:
+                    state['game_over'] = True
+                
+                yield f"data: {json.dumps({'guess': guess, 'correct': correct, 'game_state': state})}\n\n"
+            
+            done = {'word': word, 'won': '_' not in state['masked_word'], 'game_state': state}
+            yield f"event: done\ndata: {json.dumps(done)}\n\n"
+        
+        return Response(stream_with_context(play()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    
     @app.route('/api/simulate', methods=['POST'])
     def run_simulation():
         """Run bot simulation"""
         try:
+            bot = registry.get(request.args.get('bot'))
             words = ['python', 'machine', 'learning', 'algorithm', 'computer']
             wins = 0
             total_guesses = 0
@@ -356,20 +739,163 @@ def create_flask_app(bot):
         except Exception as e:
             return jsonify({'success': False, 'error': str(e)})
     
+    @app.route('/healthz')
+    def healthz():
+        """Liveness: the process is up and serving requests"""
+        return jsonify({'status': 'ok'})
+    
+    @app.route('/readyz')
+    def readyz():
+        """Readiness: 200 once the models are loaded, 503 while warming up"""
+        if not registry.ready.is_set():
+            return jsonify({'ready': False, 'status': 'warming up', 'loading': registry.loading}), 503
+        if not registry.names():
+            return jsonify({'ready': False, 'status': 'no bots loaded', 'loading': registry.loading}), 503
+        return jsonify({'ready': True, 'bots': registry.names(), 'default': registry.default})
+    
+    @app.route('/api/bots')
+    def list_bots():
+        """List the registered bot variants"""
+        return jsonify({
+            'success': True,
+            'bots': registry.names(),
+            'default': registry.default,
+            'loading': registry.loading
+        })
+    
+    def admin_denied():
+        """
+        Error response for a request not allowed to change bots (None if allowed)
+        
+        Requests from this machine are allowed; others need the admin token.
+        """
+        if request.remote_addr in ('127.0.0.1', '::1'):
+            return None
+        sent = request.headers.get('X-Admin-Token', '')
+        if admin_token and hmac.compare_digest(sent.encode(), admin_token.encode()):
+            return None
+        return jsonify({'success': False, 'error': 'Bot admin routes need a local request or a valid X-Admin-Token'}), 403
+    
+    @app.route('/api/bots/<name>/words', methods=['POST'])
+    def update_words(name):
+        """Add and/or remove training words of a running bot: {"add": [...], "remove": [...]}"""
+        denied = admin_denied()
+        if denied:
+            return denied
+        payload = request.get_json(silent=True) or {}
+        try:
+            bot = registry.get(name)
+        except LookupError as e:
+            return jsonify({'success': False, 'error': str(e)}), 404
+        if not (hasattr(bot, 'add_words') and hasattr(bot, 'remove_words')):
+            return jsonify({'success': False, 'error': f"Bot '{name}' does not support vocabulary updates"}), 400
+        
+        removed = bot.remove_words(payload.get('remove', []))
+        added = bot.add_words(payload.get('add', []))
+        return jsonify({'success': True, 'bot': name, 'added': added, 'removed': removed})
+    
+    @app.route('/api/bots/<name>/load', methods=['POST'])
+    def load_bot(name):
+        """Load <artifact_dir>/<artifact> in the background and swap it in as bot <name>"""
+        denied = admin_denied()
+        if denied:
+            return denied
+        artifact = (request.get_json(silent=True) or {}).get('artifact', f"{name}.pkl")
+        
+        # Only artifacts inside artifact_dir may be loaded (they are pickles)
+        artifact_path = Path(artifact_dir) / Path(artifact).name
+        if not artifact_path.is_file():
+            return jsonify({'success': False, 'error': f"Artifact not found: {artifact_path}"}), 404
+        
+        registry.load_in_background(name, str(artifact_path))
+        return jsonify({'success': True, 'status': 'loading', 'bot': name}), 202
+    
     return app
 
 # =============================================================================
 # DASH WEB INTERFACE (Alternative to Flask)
 # =============================================================================
 
-def create_dash_app(bot):
+# Games the rolling win rate of the live simulation chart is averaged over
+ROLLING_WINDOW = 100
+
+# Points of the rolling win rate sent with each live chart update
+LIVE_CHART_POINTS = 100
+
+def _rolling_win_rates(outcomes, window=ROLLING_WINDOW, wins_in_window=0, start=0):
+    """
+    Rolling win rate after each game of outcomes[start:]
+    
+    Args:
+        outcomes: True/False per game played so far
+        window: Games averaged over
+        wins_in_window: Wins among the window games before outcomes[start]
+        start: First game to compute a rate for
+    
+    Returns:
+        tuple: (list of rates in %, wins in the window after the last game)
+    """
+    rates = []
+    for i in range(start, len(outcomes)):
+        wins_in_window += outcomes[i]
+        if i >= window:
+            wins_in_window -= outcomes[i - window]
+        rates.append(100 * wins_in_window / min(i + 1, window))
+    return rates, wins_in_window
+
+def _downsample(values, max_points=LIVE_CHART_POINTS):
+    """
+    Evenly spaced points of a series, always ending with its last point
+    
+    Returns:
+        tuple: (1-based positions, values at those positions)
+    """
+    step = max(1, -(-len(values) // max_points))
+    positions = list(range(len(values) - 1, -1, -step))[::-1]
+    return [i + 1 for i in positions], [values[i] for i in positions]
+
+def _rolling_win_figure(outcomes, window=ROLLING_WINDOW):
+    """Line chart of the rolling win rate over the games played so far"""
+    rolling, _ = _rolling_win_rates(outcomes, window)
+    
+    fig = go.Figure(go.Scatter(x=list(range(1, len(rolling) + 1)), y=rolling, mode='lines'))
+    fig.update_layout(title=f"Rolling Win Rate (last {window} games)",
+                      xaxis_title="Games Played", yaxis_title="Win Rate (%)",
+                      yaxis_range=[0, 100])
+    return fig
+
+def _length_win_figure(length_stats):
+    """Bar chart of win rate per word length"""
+    lengths = sorted(length_stats)
+    win_rates = [100 * length_stats[n]['wins'] / length_stats[n]['total'] for n in lengths]
+    
+    fig = go.Figure(go.Bar(x=lengths, y=win_rates))
+    fig.update_layout(title="Win Rate by Word Length",
+                      xaxis_title="Word Length", yaxis_title="Win Rate (%)",
+                      yaxis_range=[0, 100])
+    return fig
+
+def create_dash_app(bot, simulation_words=None):
     """Create Dash web interface (pure Python, no HTML/CSS/JS needed!)"""
     
     if not DASH_AVAILABLE:
         print("Dash not available. Install with: pip install dash plotly")
         return None
     
-    app = dash.Dash(__name__)
+    # Words the simulation samples from (falls back to the bot's own training words)
+    if simulation_words is None:
+        simulation_words = getattr(bot, 'training_words', None) or \
+            ['python', 'machine', 'learning', 'algorithm', 'computer']
+    simulation_words = list(simulation_words)
+    
+    # Long simulations run in a separate process so the server stays responsive
+    if BACKGROUND_CALLBACKS_AVAILABLE:
+        cache = diskcache.Cache("./.dash_cache")
+        background_callback_manager = dash.DiskcacheManager(cache)
+        app = dash.Dash(__name__, background_callback_manager=background_callback_manager)
+    else:
+        print("Background simulations not available. Install with: pip install \"dash[diskcache]\"")
+        app = dash.Dash(__name__)
     
     # Define layout using Python components
     app.layout = html.Div([
@@ -392,6 +918,14 @@ def create_dash_app(bot):
             html.Button("Get Bot Guess", id="guess-btn", n_clicks=0, style={'margin': '5px'}),
             html.Button("New Game", id="new-game-btn", n_clicks=0, style={'margin': '5px'}),
             html.Button("Run Simulation", id="simulate-btn", n_clicks=0, style={'margin': '5px'}),
+            html.Button("Cancel", id="cancel-btn", n_clicks=0, disabled=True, style={'margin': '5px'}),
+        ], style={'textAlign': 'center', 'margin': '20px'}),
+        
+        # Simulation settings and progress
+        html.Div([
+            html.Span("Words to simulate: "),
+            dcc.Input(id="sim-word-count", type="number", min=1, step=1, value=1000, style={'width': '100px'}),
+            html.Progress(id="sim-progress", value="0", max="1000", style={'width': '60%', 'marginLeft': '20px'}),
         ], style={'textAlign': 'center', 'margin': '20px'}),
         
         # Statistics
@@ -410,6 +944,10 @@ def create_dash_app(bot):
             ], className="stat-card"),
         ], className="stats"),
         
+        # Live simulation charts
+        dcc.Graph(id="rolling-win-chart", figure=_rolling_win_figure([])),
+        dcc.Graph(id="length-win-chart", figure=_length_win_figure({})),
+        
         # Results
         html.Div(id="simulation-results"),
         
@@ -510,61 +1048,113 @@ def create_dash_app(bot):
                 ', '.join(game_state['wrong_guesses']),
                 json.dumps(game_state))
     
-    @app.callback(
-        [Output("win-rate", "children"),
-         Output("games-played", "children"),
-         Output("avg-guesses", "children"),
-         Output("simulation-results", "children")],
-        [Input("simulate-btn", "n_clicks")]
-    )
-    def run_simulation(n_clicks):
-        """Run bot simulation"""
-        if n_clicks == 0:
-            return "0%", "0", "0", ""
-        
-        words = ['python', 'machine', 'learning', 'algorithm', 'computer']
-        wins = 0
-        total_guesses = 0
-        
-        for word in words:
-            masked_word = '_' * len(word)
-            wrong_guesses = set()
-            lives = 6
-            guesses = 0
-            
-            while lives > 0 and '_' in masked_word:
-                guess = bot.predict_next_letter(masked_word, wrong_guesses)
-                guesses += 1
-                
-                if guess in word:
-                    new_masked = ""
-                    for i, char in enumerate(word):
-                        if char == guess:
-                            new_masked += char
-                        else:
-                            new_masked += masked_word[i]
-                    masked_word = new_masked
-                else:
-                    wrong_guesses.add(guess)
-                    lives -= 1
-            
-            if '_' not in masked_word:
-                wins += 1
-            total_guesses += guesses
-        
-        win_rate = round((wins / len(words)) * 100, 1)
-        avg_guesses = round(total_guesses / len(words), 1)
+    def simulation_summary(games_played, wins, total_guesses):
+        """Build the stat-card values and results panel for a finished simulation"""
+        win_rate = round((wins / games_played) * 100, 1) if games_played else 0
+        avg_guesses = round(total_guesses / games_played, 1) if games_played else 0
         
         results = html.Div([
             html.H3("Simulation Results"),
-            html.P(f"Games Played: {len(words)}"),
+            html.P(f"Games Played: {games_played}"),
             html.P(f"Wins: {wins}"),
-            html.P(f"Losses: {len(words) - wins}"),
+            html.P(f"Losses: {games_played - wins}"),
             html.P(f"Win Rate: {win_rate}%"),
             html.P(f"Average Guesses: {avg_guesses}")
         ], style={'backgroundColor': '#f0f8ff', 'padding': '20px', 'borderRadius': '10px', 'margin': '20px'})
         
-        return f"{win_rate}%", str(len(words)), str(avg_guesses), results
+        return f"{win_rate}%", str(games_played), str(avg_guesses), results
+    
+    if BACKGROUND_CALLBACKS_AVAILABLE:
+        @app.callback(
+            [Output("win-rate", "children"),
+             Output("games-played", "children"),
+             Output("avg-guesses", "children"),
+             Output("simulation-results", "children"),
+             Output("rolling-win-chart", "figure", allow_duplicate=True),
+             Output("length-win-chart", "figure", allow_duplicate=True)],
+            [Input("simulate-btn", "n_clicks")],
+            [State("sim-word-count", "value")],
+            background=True,
+            prevent_initial_call=True,
+            running=[
+                (Output("simulate-btn", "disabled"), True, False),
+                (Output("cancel-btn", "disabled"), False, True),
+            ],
+            cancel=[Input("cancel-btn", "n_clicks")],
+            progress=[Output("sim-progress", "value"),
+                      Output("sim-progress", "max"),
+                      Output("rolling-win-chart", "figure"),
+                      Output("length-win-chart", "figure")],
+        )
+        def run_simulation(set_progress, n_clicks, word_count):
+            """Run bot simulation in the background, streaming partial results"""
+            word_count = max(1, int(word_count or 1))
+            words = random.choices(simulation_words, k=word_count)
+            
+            # Refresh the charts about 100 times per run, whatever its size
+            update_every = max(1, word_count // 100)
+            outcomes = []
+            length_stats = {}
+            wins = 0
+            total_guesses = 0
+            
+            # Rolling win rate after every game so far, extended at each update
+            rates = []
+            wins_in_window = 0
+            
+            for i, word in enumerate(words, 1):
+                result = simulate_game(bot, word)
+                outcomes.append(result['won'])
+                
+                stats = length_stats.setdefault(len(word), {'total': 0, 'wins': 0})
+                stats['total'] += 1
+                if result['won']:
+                    stats['wins'] += 1
+                    wins += 1
+                total_guesses += result['guesses']
+                
+                if i % update_every == 0 or i == word_count:
+                    new_rates, wins_in_window = _rolling_win_rates(outcomes, wins_in_window=wins_in_window,
+                                                                   start=len(rates))
+                    rates += new_rates
+                    
+                    # The browser only sees the latest update it polls, so each one
+                    # carries the whole (downsampled) line, not just the new points
+                    games, sampled = _downsample(rates)
+                    rolling = Patch()
+                    rolling['data'][0]['x'] = games
+                    rolling['data'][0]['y'] = sampled
+                    
+                    set_progress((str(i), str(word_count), rolling, _length_win_figure(length_stats)))
+            
+            # The finished run sends the charts at full resolution
+            return simulation_summary(word_count, wins, total_guesses) + \
+                (_rolling_win_figure(outcomes), _length_win_figure(length_stats))
+    else:
+        @app.callback(
+            [Output("win-rate", "children"),
+             Output("games-played", "children"),
+             Output("avg-guesses", "children"),
+             Output("simulation-results", "children")],
+            [Input("simulate-btn", "n_clicks")],
+            [State("sim-word-count", "value")]
+        )
+        def run_simulation(n_clicks, word_count):
+            """Run bot simulation"""
+            if n_clicks == 0:
+                return "0%", "0", "0", ""
+            
+            words = random.choices(simulation_words, k=max(1, int(word_count or 1)))
+            wins = 0
+            total_guesses = 0
+            
+            for word in words:
+                result = simulate_game(bot, word)
+                if result['won']:
+                    wins += 1
+                total_guesses += result['guesses']
+            
+            return simulation_summary(len(words), wins, total_guesses)
     
     return app
 
@@ -572,25 +1162,53 @@ def create_dash_app(bot):
 # MAIN EXECUTION
 # =============================================================================
 
+def load_training_words() -> List[str]:
+    """Load training_words.txt (sample words if it is missing)"""
+    try:
+        with open('training_words.txt', 'r') as f:
+            return [line.strip() for line in f if line.strip()]
+    except FileNotFoundError:
+        print("training_words.txt not found. Using sample words.")
+        return ['python', 'machine', 'learning', 'algorithm', 'computer'] * 1000
+
 def main():
     """Main function to run the web interface"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Hangman ML Challenge web interface")
+    parser.add_argument('--artifact-dir', default='artifacts',
+                        help="Directory of saved bot artifacts to serve")
+    parser.add_argument('--build-artifacts', action='store_true',
+                        help="Train every bot variant, save the artifacts and exit")
+    args = parser.parse_args()
+    
     print("Hangman ML Challenge - Web Interface")
     print("=" * 50)
     
-    # Load training data
-    try:
-        with open('training_words.txt', 'r') as f:
-            training_words = [line.strip() for line in f if line.strip()]
-    except FileNotFoundError:
-        print("training_words.txt not found. Using sample words.")
-        training_words = ['python', 'machine', 'learning', 'algorithm', 'computer'] * 1000
+    if args.build_artifacts:
+        build_bot_artifacts(load_training_words(), args.artifact_dir)
+        return
+    
+    def build(registry):
+        """Serve every saved bot variant, or train the template bot if there are none"""
+        for artifact_path in sorted(Path(args.artifact_dir).glob('*.pkl')):
+            print(f"Loading bot '{artifact_path.stem}' from {artifact_path}")
+            try:
+                registry.load(artifact_path.stem, str(artifact_path))
+            except ValueError as e:
+                print(f"Skipping stale artifact: {e}")
+        if not registry.names():
+            registry.register('template', HangmanBot(load_training_words()))
+        if registry.default not in registry.names():
+            registry.default = registry.names()[0]
     
-    # Create bot
-    bot = HangmanBot(training_words)
+    # Start serving right away; until the models are ready, /readyz reports 503
+    # and /api/guess is answered by a frequency-only bot
+    registry = BotRegistry(default='template', fallback=FrequencyBot())
+    registry.warm_up(build)
     
     # Start Flask app by default (production-ready)
-    print("Starting Flask web interface...")
-    app = create_flask_app(bot)
+    print("Starting Flask web interface (models warming up in the background)...")
+    app = create_flask_app(registry, args.artifact_dir)
     app.run(debug=False, host='0.0.0.0', port=5000)
 
 if __name__ == "__main__":